@@ -10,6 +10,7 @@ This module provides robust speech detection for interruption handling:
 The interruption monitor runs in a separate thread and uses direct audio sampling
 for reliable detection of user speech during TTS output.
 """
+import math
 import threading
 import time
 import numpy as np
@@ -194,12 +195,16 @@ class InterruptionMonitor:
                         # Record a short audio sample
                         audio_data, overflowed = stream.read(stream.blocksize)
                         
-                        # Convert to float and calculate energy
-                        audio_float = audio_data.flatten().astype(np.float32) / 32768.0
-                        energy = np.sqrt(np.mean(audio_float**2))
+                        # Convert to float (one new array, scaled in place) and
+                        # calculate RMS energy from a single dot product rather
+                        # than a squared temporary and a mean
+                        audio_float = audio_data.reshape(-1).astype(np.float32)
+                        audio_float *= 1.0 / 32768.0
+                        energy = math.sqrt(float(np.dot(audio_float, audio_float)) / audio_float.size)
                         
-                        # Store in pre-buffer for potential capture
-                        self.pre_buffer.append(audio_float.copy())
+                        # Store in pre-buffer for potential capture (the block is
+                        # never modified afterwards, so both buffers can share it)
+                        self.pre_buffer.append(audio_float)
                         
                         # Keep pre-buffer at appropriate size
                         pre_buffer_size = int(self.audio_pre_buffer_duration / 0.05)  # 50ms blocks
@@ -208,7 +213,7 @@ class InterruptionMonitor:
                             
                         # Also store in continuous capture buffer if we're in detection mode
                         if hasattr(self, 'in_detection_mode') and self.in_detection_mode:
-                            self.capture_buffer.append(audio_float.copy())
+                            self.capture_buffer.append(audio_float)
                         
                         # Add to history
                         energy_history.append(energy)
@@ -229,10 +234,6 @@ class InterruptionMonitor:
                         
                         # Check for interruption
                         if baseline is not None:
-                            # Visualize energy level
-                            bar_length = int(min(80, max(0, energy * 80 / 0.1)))
-                            bar = '|' + '█' * bar_length + '|'
-                            
                             # Keep track of recent energy values for pattern detection
                             if not hasattr(self, 'recent_energies'):
                                 self.recent_energies = []
@@ -264,7 +265,6 @@ class InterruptionMonitor:
                                 if self._validate_speech_pattern():
                                     print(f"🛑 SPEECH INTERRUPTION DETECTED! Energy: {energy:.6f}")
                                     self.was_interrupted = True
-                                    self.interruption_event.set()
                                     
                                     # Use the already captured audio from continuous capture
                                     if self.continuous_capture and hasattr(self, 'in_detection_mode') and self.in_detection_mode:
@@ -278,6 +278,10 @@ class InterruptionMonitor:
                                     if self.interruption_callback:
                                         self.interruption_callback()
                                     
+                                    # Wake anyone waiting on the event only once the
+                                    # audio is saved and the callback has run
+                                    self.interruption_event.set()
+                                    
                                     break
                                 else:
                                     print(f"⚠️ Energy spike detected but doesn't match speech pattern")
@@ -440,32 +444,34 @@ class InterruptionMonitor:
         """
         return self.interruption_audio_file if os.path.exists(self.interruption_audio_file or "") else None
     
-    def cleanup_old_audio_files(self, max_files: int = 10, max_age_hours: int = 24) -> int:
+    def cleanup_old_audio_files(self, max_files: int = 10, max_age_hours: int = 24,
+                                directory: str = "audio_cache") -> int:
         """Clean up old interruption audio files to prevent disk space issues
         
         Args:
             max_files: Maximum number of files to keep (default: 10)
             max_age_hours: Maximum age of files in hours (default: 24)
+            directory: Directory holding the interruption audio (default: audio_cache)
             
         Returns:
             int: Number of files deleted
         """
         try:
-            if not os.path.exists("audio_cache"):
+            if not os.path.exists(directory):
                 return 0
                 
             # Get all interruption audio files
             audio_files = []
-            for filename in os.listdir("audio_cache"):
-                if filename.startswith("interruption_") and filename.endswith(".wav"):
-                    filepath = os.path.join("audio_cache", filename)
-                    stat = os.stat(filepath)
-                    audio_files.append({
-                        'path': filepath,
-                        'name': filename,
-                        'mtime': stat.st_mtime,
-                        'size': stat.st_size
-                    })
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("interruption_") and entry.name.endswith(".wav"):
+                        stat = entry.stat()
+                        audio_files.append({
+                            'path': entry.path,
+                            'name': entry.name,
+                            'mtime': stat.st_mtime,
+                            'size': stat.st_size
+                        })
             
             if not audio_files:
                 return 0
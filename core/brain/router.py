@@ -28,12 +28,20 @@ import re
 import openai
 import sys
 import os
+import threading
 from typing import Optional, Dict, Any, List
 
 # Add the core directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.config import config
 
+# Action words and app names for the app-control fallback that catches
+# commands the patterns miss (e.g. misheard app names)
+APP_ACTION_WORDS = frozenset({'open', 'launch', 'start', 'run'})
+FALLBACK_APP_NAMES = frozenset({
+    'chrome', 'safari', 'firefox', 'browser', 'finder', 'terminal', 'calculator', 'calendar'
+})
+
 class NovaBrain:
     """Main brain that routes commands and generates responses"""
     
@@ -42,6 +50,10 @@ class NovaBrain:
         self.skills = {}
         self.openai_client = None
         
+        # Guards conversation_history and lazily created skill instances, so
+        # one brain can serve several threads at once
+        self._lock = threading.Lock()
+        
         # Initialize OpenAI client if API key is available
         if config.openai_api_key:
             try:
@@ -225,13 +237,23 @@ class NovaBrain:
                 r'\b(\d+\s*[\+\-\*\/]\s*\d+|\d+\s+plus\s+\d+|\d+\s+minus\s+\d+)\b'
             ]
         }
+        
+        # Each skill's patterns merged into one compiled alternation, so matching
+        # a command costs one regex scan per skill instead of one per pattern
+        self.skill_regexes = {
+            skill_name: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+            for skill_name, patterns in self.skill_patterns.items()
+        }
     
-    def process_input(self, user_input: str, stream: bool = False):
+    def process_input(self, user_input: str, stream: bool = False,
+                      matched_skill: Optional[str] = None):
         """Process user input and return appropriate response
         
         Args:
             user_input: The user's input text
             stream: If True, returns a generator that yields response chunks
+            matched_skill: The skill already matched for this input (see
+                _get_matching_skill); when omitted the input is matched here
         
         Returns:
             If stream=False: A string containing the full response
@@ -240,6 +262,18 @@ class NovaBrain:
         if not user_input.strip():
             return "I didn't catch that. Could you please repeat?"
         
+        user_input_lower = user_input.lower()
+        if matched_skill is None:
+            matched_skill = self._match_input(user_input_lower)
+        return self._process(user_input, user_input_lower, matched_skill, stream)
+    
+    def _process(self, user_input: str, user_input_lower: str,
+                 matched_skill: Optional[str], stream: bool = False):
+        """Route already lowercased and matched input to a response
+        
+        Shared by process_input and process_batch so each command is
+        lowercased and matched against the skill patterns only once.
+        """
         # 1. Check for conversation closure signals (only standalone phrases)
         closure_phrases = [
             "that's all", "that'll be all", 
@@ -251,7 +285,6 @@ class NovaBrain:
         simple_thanks = ["thank you", "thanks"]
         
         is_closure = False
-        user_input_lower = user_input.lower()
         
         # Check if this is just a simple thank you without a question
         contains_question = any(q in user_input_lower for q in ["?", "what", "when", "where", "how", "who", "which", "can", "could", "would", "will", "do i", "am i", "is there"])
@@ -271,58 +304,25 @@ class NovaBrain:
                     is_closure = True
                     break
         
-        # Add user input to conversation history
-        self.conversation_history.append({"role": "user", "content": user_input})
-        
         # 2. Handle conversation closure with a polite acknowledgment
         if is_closure:
             acknowledgment = "Very good, Sir. I'll be here if you need anything else."
-            self.conversation_history.append({"role": "assistant", "content": acknowledgment})
+            self._record_exchange(user_input, acknowledgment)
             return acknowledgment
         
-        # 3. Prioritize app control commands (e.g., "open Chrome")
-        # This ensures Nova can actually control apps even in conversational context
-        app_control_match = False
-        
-        # Enhanced logging for app control detection
-        print(f"🔍 Checking if input is app control command: '{user_input}'")
-        
-        # Check if this is an app control command using regex patterns
-        for pattern in self.skill_patterns['app_control']:
-            if re.search(pattern, user_input_lower):
-                app_control_match = True
-                matched_pattern = pattern
-                print(f"✅ App control pattern matched: '{matched_pattern}'")
-                break
-        
-        # Special handling for common voice transcription errors with app names
-        app_keywords = ['open', 'launch', 'start', 'run']
-        if any(keyword in user_input_lower for keyword in app_keywords):
-            print(f"🔍 App action keyword detected, checking for app names...")
-            # This might be an app control command that wasn't matched by the patterns
-            words = user_input_lower.split()
-            for i, word in enumerate(words):
-                if word in app_keywords and i < len(words) - 1:
-                    potential_app = words[i+1]
-                    print(f"🔍 Potential app name detected: '{potential_app}'")
-                    # Force app control match for common apps that might be misheard
-                    if potential_app in ['chrome', 'safari', 'firefox', 'browser', 'finder', 'terminal', 'calculator', 'calendar']:
-                        app_control_match = True
-                        print(f"✅ Forced app control match for: '{potential_app}'")
-                        break
-        
-        # Execute app control commands directly
-        if app_control_match:
+        # 3. App control commands (e.g., "open Chrome") take priority, so Nova
+        # can actually control apps even in conversational context
+        if matched_skill == 'app_control':
             print(f"🚀 Executing app control for: '{user_input}'")
             skill_response = self._handle_app_control(user_input)
-            self.conversation_history.append({"role": "assistant", "content": skill_response})
+            self._record_exchange(user_input, skill_response)
             return skill_response
         
-        # For other skills, use the normal detection
-        skill_response = self._try_skills(user_input)
+        # For other skills, run the matched one
+        skill_response = self._execute_skill(matched_skill, user_input) if matched_skill else None
         if skill_response:
-            # Add skill response to history
-            self.conversation_history.append({"role": "assistant", "content": skill_response})
+            # Add the exchange to history
+            self._record_exchange(user_input, skill_response)
             return skill_response
         
         # Fallback to LLM if available
@@ -334,38 +334,88 @@ class NovaBrain:
             # Otherwise, get the full response
             llm_response = self._get_llm_response(user_input)
             if llm_response:
-                # Note: When not streaming, we add response to history in _get_llm_response
+                # Note: When streaming, _stream_llm_response adds the exchange once the reply is complete
+                self._record_exchange(user_input, llm_response)
                 return llm_response
         
         # Final fallback
         fallback = "I'm not sure how to help with that yet. Could you try asking me to open an app, check the time, or ask about your agenda?"
-        self.conversation_history.append({"role": "assistant", "content": fallback})
+        self._record_exchange(user_input, fallback)
         return fallback
     
-    def _try_skills(self, user_input: str) -> Optional[str]:
-        """Try to match user input with available skills
+    def _record_exchange(self, user_input: str, response: str):
+        """Append a user message and Nova's reply to the history as one pair
         
-        This method checks if the user's input matches any of the defined skill patterns
-        and executes the corresponding skill if a match is found.
+        Both messages go in under the lock, so concurrent callers never
+        interleave each other's user/assistant turns.
+        """
+        with self._lock:
+            self.conversation_history.append({"role": "user", "content": user_input})
+            self.conversation_history.append({"role": "assistant", "content": response})
+    
+    def process_batch(self, commands: List[str]) -> List[str]:
+        """Process several independent commands in order
         
-        Note: App control skills are handled separately for better prioritization.
+        Skill instances, patterns and the LLM client are set up once on the
+        brain and shared by every command in the batch; each command is
+        lowercased and matched once, and that match drives its routing.
+        
+        Args:
+            commands: The user inputs to process
+        
+        Returns:
+            List[str]: One response per command, in the same order
+        """
+        responses = []
+        for command in commands:
+            if not command.strip():
+                responses.append("I didn't catch that. Could you please repeat?")
+                continue
+            command_lower = command.lower()
+            matched_skill = self._match_input(command_lower)
+            responses.append(self._process(command, command_lower, matched_skill))
+        return responses
+    
+    def matches_any_skill(self, user_input: str) -> bool:
+        """Check whether the input would be handled by a skill rather than the LLM"""
+        return self._get_matching_skill(user_input) is not None
+    
+    def _get_matching_skill(self, user_input: str) -> Optional[str]:
+        """Return the name of the skill that would handle the input, if any
+        
+        Uses the same routing as process_input: app control first (patterns
+        plus the app-name fallback), then the remaining skills in pattern order.
         
         Args:
             user_input: The user's input text
             
         Returns:
-            Optional[str]: The skill response if a match is found, None otherwise
+            Optional[str]: The matching skill name, or None if no skill matches
         """
-        user_input_lower = user_input.lower()
-        
-        for skill_name, patterns in self.skill_patterns.items():
+        return self._match_input(user_input.lower())
+    
+    def _match_input(self, user_input_lower: str) -> Optional[str]:
+        """Return the skill that would handle the lowercased input, if any"""
+        if self.skill_regexes['app_control'].search(user_input_lower):
+            return 'app_control'
+        
+        # Catch app commands the patterns miss (e.g. misheard app names)
+        words = user_input_lower.split()
+        for word, next_word in zip(words, words[1:]):
+            if word in APP_ACTION_WORDS and next_word in FALLBACK_APP_NAMES:
+                return 'app_control'
+        
+        return self._match_skill(user_input_lower)
+    
+    def _match_skill(self, user_input_lower: str) -> Optional[str]:
+        """Return the first non-app-control skill whose patterns match the lowercased input"""
+        for skill_name, regex in self.skill_regexes.items():
             # Skip app_control as it's handled separately in process_input
             if skill_name == 'app_control':
                 continue
                 
-            for pattern in patterns:
-                if re.search(pattern, user_input_lower):
-                    return self._execute_skill(skill_name, user_input)
+            if regex.search(user_input_lower):
+                return skill_name
         
         return None
     
@@ -590,9 +640,13 @@ class NovaBrain:
     
     def _handle_calendar(self, user_input: str) -> str:
         """Handle calendar-related requests using the CalendarSkill"""
-        from core.skills.calendar_skill import CalendarSkill
-        
-        calendar_skill = CalendarSkill()
+        with self._lock:
+            if 'calendar' not in self.skill_instances:
+                # Created on first use (Google auth is slow), then reused so later
+                # queries share the same authenticated calendar client
+                from core.skills.calendar_skill import CalendarSkill
+                self.skill_instances['calendar'] = CalendarSkill()
+            calendar_skill = self.skill_instances['calendar']
         return calendar_skill.handle_query(user_input)
         
     def _handle_notes(self, user_input: str) -> str:
@@ -712,9 +766,12 @@ class NovaBrain:
             
             messages = [{"role": "system", "content": enhanced_persona}]
             
-            # Add recent conversation history (last 20 exchanges)
-            recent_history = self.conversation_history[-20:]  # Last 20 messages
+            # Add recent conversation history (last 20 messages), then the
+            # current input, which is recorded once the reply is known
+            with self._lock:
+                recent_history = self.conversation_history[-20:]
             messages.extend(recent_history)
+            messages.append({"role": "user", "content": user_input})
             
             # Check if this is a simple affirmation after opening an app
             user_input_lower = user_input.lower()
@@ -722,7 +779,7 @@ class NovaBrain:
             
             # Check if the last assistant message was about opening an app
             last_assistant_msg = ""
-            for msg in reversed(self.conversation_history):
+            for msg in reversed(recent_history):
                 if msg["role"] == "assistant":
                     last_assistant_msg = msg["content"].lower()
                     break
@@ -740,7 +797,7 @@ class NovaBrain:
             
             # If streaming is requested, return a generator
             if stream:
-                return self._stream_llm_response(client, messages)
+                return self._stream_llm_response(client, messages, user_input)
             
             # Otherwise, get the full response at once
             response = client.chat.completions.create(
@@ -756,7 +813,7 @@ class NovaBrain:
             print(f"Error getting LLM response: {e}")
             return None
             
-    def _stream_llm_response(self, client, messages):
+    def _stream_llm_response(self, client, messages, user_input):
         """Stream response chunks from the LLM in real-time
         
         This method enables streaming responses from the OpenAI API,
@@ -767,6 +824,7 @@ class NovaBrain:
         Args:
             client: The OpenAI client instance
             messages: The conversation history and system messages
+            user_input: The user's input, recorded with the reply in history
             
         Returns:
             Generator: A generator that yields response chunks as they arrive
@@ -795,8 +853,8 @@ class NovaBrain:
                     full_response += content
                     yield content
             
-            # Add the full response to conversation history
-            self.conversation_history.append({"role": "assistant", "content": full_response})
+            # Add the exchange to conversation history
+            self._record_exchange(user_input, full_response)
             
         except Exception as e:
             print(f"Error streaming LLM response: {e}")
@@ -815,5 +873,6 @@ class NovaBrain:
     
     def clear_history(self):
         """Clear conversation history"""
-        self.conversation_history.clear()
+        with self._lock:
+            self.conversation_history.clear()
         print("Conversation history cleared.")
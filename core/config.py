@@ -24,6 +24,9 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# Day names as they appear in course/activity "days" lists
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 class NovaConfig:
     """Configuration manager for Hey Nova"""
     
@@ -127,6 +130,14 @@ class NovaConfig:
             self.academic_goals = ["Excel in courses"]
             self.interests = ["Technology"]
         
+        # Courses and activities grouped by weekday name, so a day's
+        # schedule is a dict lookup rather than a scan of every entry
+        self._index_by_weekday()
+        
+        # Today's classes and activities only change when the date does, so
+        # they're filtered once per day: (date, todays_classes, todays_activities)
+        self._todays_schedule_cache = None
+        
         # persona prompt
         self.persona = f"""You are Nova, a sophisticated AI assistant serving {self.user_name} at the University of Rochester.
 
@@ -204,6 +215,49 @@ class NovaConfig:
             "pitch": self.voice_pitch
         }
     
+    def _index_by_weekday(self):
+        """Build courses_by_day and activities_by_day from courses and activities"""
+        self.courses_by_day = {
+            day: [course for course in self.courses if day in course.get("days", ())]
+            for day in WEEKDAY_NAMES
+        }
+        self.activities_by_day = {
+            day: [activity for activity in self.activities
+                  if activity.get("frequency") == "daily" or day in activity.get("days", ())]
+            for day in WEEKDAY_NAMES
+        }
+    
+    def _get_todays_schedule(self, current_time) -> tuple:
+        """Get (todays_classes, todays_activities) for current_time's date, filtered once per day"""
+        today = current_time.date()
+        cached = self._todays_schedule_cache
+        if cached is None or cached[0] != today:
+            current_day = current_time.strftime("%A")
+            
+            # Find today's classes
+            todays_classes = []
+            for course in self.courses_by_day.get(current_day, ()):
+                todays_classes.append({
+                    "name": course["name"],
+                    "code": course["code"],
+                    "time": course["time"],
+                    "location": course["location"],
+                    "professor": course["professor"]
+                })
+            
+            # Get today's activities
+            todays_activities = list(self.activities_by_day.get(current_day, ()))
+            
+            cached = self._todays_schedule_cache = (today, todays_classes, todays_activities)
+        
+        # Copies, so callers can't edit the cached lists
+        return list(cached[1]), list(cached[2])
+    
+    def invalidate_context(self):
+        """Re-index courses and activities and drop today's cached schedule after they change"""
+        self._index_by_weekday()
+        self._todays_schedule_cache = None
+    
     def get_personal_context(self) -> dict:
         """Get personal context for enhanced responses"""
         from datetime import datetime
@@ -214,24 +268,7 @@ class NovaConfig:
             tz = pytz.timezone(self.timezone)
             current_time = datetime.now(tz)
             current_day = current_time.strftime("%A")
-            
-            # Find today's classes
-            todays_classes = []
-            for course in self.courses:
-                if current_day in course["days"]:
-                    todays_classes.append({
-                        "name": course["name"],
-                        "code": course["code"],
-                        "time": course["time"],
-                        "location": course["location"],
-                        "professor": course["professor"]
-                    })
-            
-            # Get today's activities
-            todays_activities = []
-            for activity in self.activities:
-                if activity["frequency"] == "daily" or current_day in activity.get("days", []):
-                    todays_activities.append(activity)
+            todays_classes, todays_activities = self._get_todays_schedule(current_time)
             
             return {
                 "user_name": self.user_name,
@@ -272,17 +309,12 @@ class NovaConfig:
             current_day = current_time.strftime("%A")
             time_greeting = self._get_time_greeting(current_time.hour)
             
-            # Find today's classes
-            todays_classes = []
-            for course in self.courses:
-                if current_day in course["days"]:
-                    todays_classes.append(f"{course['name']} ({course['code']}) at {course['time']} in {course['location']}")
-            
-            # Check if basketball practice is today (it's daily)
-            activities_today = []
-            for activity in self.activities:
-                if activity["frequency"] == "daily" or current_day in activity.get("days", []):
-                    activities_today.append(f"{activity['name']} at {activity['time']} in {activity['location']}")
+            # Today's classes and activities (basketball practice is daily)
+            classes, activities = self._get_todays_schedule(current_time)
+            todays_classes = [f"{course['name']} ({course['code']}) at {course['time']} in {course['location']}"
+                              for course in classes]
+            activities_today = [f"{activity['name']} at {activity['time']} in {activity['location']}"
+                                for activity in activities]
             
             # Build schedule context
             schedule_context = "No classes or activities scheduled for today."
@@ -319,14 +351,8 @@ class NovaConfig:
     
     def _get_time_greeting(self, hour: int) -> str:
         """Get appropriate greeting based on time of day"""
-        if 5 <= hour < 12:
-            return "Good morning"
-        elif 12 <= hour < 17:
-            return "Good afternoon"
-        elif 17 <= hour < 21:
-            return "Good evening"
-        else:
-            return "Good night"
+        from core.utils.time_greeting import get_time_greeting
+        return get_time_greeting(hour)
 
 # Global config instance
 config = NovaConfig()
@@ -8,6 +8,7 @@ import os
 import json
 import datetime
 import sys
+import time
 from typing import List, Dict, Any, Optional
 import requests
 
@@ -33,7 +34,11 @@ class NotionClient:
         self.cache_duration = 300  # Cache results for 5 minutes
     
     def is_available(self) -> bool:
-        """Check if the Notion API is available and configured"""
+        """Check if the Notion API is available and configured
+        
+        This only inspects the configured key and database ID; no request
+        is made, so it is cheap to call before every query.
+        """
         return bool(self.api_key and self.database_id)
     
     def query_database(self, database_id: Optional[str] = None, 
@@ -52,8 +57,9 @@ class NotionClient:
         # Create cache key based on parameters
         cache_key = f"db_{db_id}_{json.dumps(filter_params)}_{json.dumps(sorts)}"
         
-        # Check cache first
-        if cache_key in self.cache and self.cache_expiry.get(cache_key, 0) > datetime.datetime.now().timestamp():
+        # Check cache first (monotonic clock, so wall-clock changes can't
+        # expire or resurrect entries)
+        if cache_key in self.cache and self.cache_expiry.get(cache_key, 0) > time.monotonic():
             return self.cache[cache_key]
         
         # Prepare request payload
@@ -74,7 +80,7 @@ class NotionClient:
             
             # Cache results
             self.cache[cache_key] = results
-            self.cache_expiry[cache_key] = datetime.datetime.now().timestamp() + self.cache_duration
+            self.cache_expiry[cache_key] = time.monotonic() + self.cache_duration
             
             return results
         except Exception as e:
@@ -21,6 +21,7 @@ import sys
 import time
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 # Add the core directory to Python path
@@ -35,17 +36,19 @@ from brain import NovaBrain
 from nova_logger import logger
 from core.services.time_based_focus import TimeBasedFocusController
 from core.services.spotify_service import SpotifyService
+from core.utils.time_greeting import get_welcome_greeting
 
 class HeyNova:
     """Main Nova assistant class"""
     
-    def __init__(self):
+    def __init__(self, tts: Optional[SpeechSynthesizer] = None, stt: Optional[SpeechTranscriber] = None):
         print("🚀 Initializing Hey Nova...")
         
-        # initialize core components
+        # initialize core components (callers that already have loaded speech
+        # components, e.g. test scripts, can pass them in to skip reloading)
         self.brain = NovaBrain()
-        self.tts = SpeechSynthesizer()
-        self.stt = SpeechTranscriber()
+        self.tts = tts if tts is not None else SpeechSynthesizer()
+        self.stt = stt if stt is not None else SpeechTranscriber()
         
         # setup interrupt handling between STT and TTS
         self.stt.set_interrupt_callback(self._interrupt_speech)
@@ -248,7 +251,12 @@ class HeyNova:
             # get current time for appropriate greeting
             from datetime import datetime
             import pytz
-            from core.services.calendar_service import CalendarService
+            
+            # Fetch the calendar in the background while private mode and
+            # Spotify are prepared; it's only needed once we build the message
+            calendar_executor = ThreadPoolExecutor(max_workers=1)
+            calendar_future = calendar_executor.submit(self._get_calendar_info)
+            calendar_executor.shutdown(wait=False)
             
             tz = pytz.timezone(config.timezone)
             current_time = datetime.now(tz)
@@ -295,22 +303,11 @@ class HeyNova:
                 print(f"Spotify integration error: {e}")
                 music_status = "error"
             
-            # 3. Get calendar information
-            calendar_info = ""
-            try:
-                calendar_service = CalendarService()
-                calendar_info = calendar_service.format_rest_of_day_schedule()
-                print("📅 Calendar information retrieved")
-            except Exception as e:
-                print(f"Error getting calendar info: {e}")
+            # 3. Get calendar information (fetched in the background above)
+            calendar_info = calendar_future.result()
             
             # NOW BUILD THE GREETING MESSAGE IN THE CORRECT ORDER
-            if 5 <= hour < 12:
-                greeting = "Good morning"
-            elif 12 <= hour < 17:
-                greeting = "Good afternoon"
-            else:
-                greeting = "Good evening"
+            greeting = get_welcome_greeting(hour)
             
             # 1. Welcome home (greet)
             welcome_message = f"{greeting}, {config.user_title}! Welcome home."
@@ -360,6 +357,21 @@ class HeyNova:
             self.conversation_state["greeting_given"] = True
             self.conversation_state["active"] = True
     
+    def _get_calendar_info(self) -> str:
+        """Get the rest of today's schedule for the welcome greeting
+        
+        Returns:
+            str: The formatted schedule, or "" if it couldn't be retrieved
+        """
+        try:
+            from core.services.calendar_service import CalendarService
+            calendar_info = CalendarService().format_rest_of_day_schedule()
+            print("📅 Calendar information retrieved")
+            return calendar_info
+        except Exception as e:
+            print(f"Error getting calendar info: {e}")
+            return ""
+    
     def _ensure_spotify_ready(self):
         """Ensure Spotify is running and ready to play music
         
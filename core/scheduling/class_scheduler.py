@@ -10,6 +10,9 @@ from datetime import datetime, time
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
 class ClassScheduler:
     """Smart scheduling based on your class schedule"""
     
@@ -20,6 +23,13 @@ class ClassScheduler:
         self.university_hours = {}
         self.nova_behavior = {}
         
+        # Parsed (start, end, class_info) periods per weekday, built once per
+        # load so the checks don't re-parse "HH:MM" strings on every call
+        self._class_periods = {}
+        
+        # One bit per minute of the week, set when any class covers that minute
+        self._in_class = bytearray(MINUTES_PER_WEEK // 8)
+        
         # Load configuration
         self._load_schedule()
         
@@ -65,6 +75,49 @@ class ClassScheduler:
         except Exception as e:
             logging.error(f"❌ Failed to load class schedule: {e}")
             self._create_default_schedule()
+            return
+        
+        self._build_class_periods()
+    
+    def _build_class_periods(self):
+        """Parse each class's start/end time once, keyed by weekday"""
+        self._class_periods = {
+            weekday: [
+                (self._parse_time(class_info.get('start', '00:00')),
+                 self._parse_time(class_info.get('end', '23:59')),
+                 class_info)
+                for class_info in classes
+            ]
+            for weekday, classes in (self.schedule_data.get('class_schedule') or {}).items()
+        }
+        
+        in_class = bytearray(MINUTES_PER_WEEK // 8)
+        for weekday, periods in self._class_periods.items():
+            if not isinstance(weekday, int) or not 0 <= weekday < 7:
+                continue
+            for start_time, end_time, _ in periods:
+                # Mark the end minute too; the exact check trims its seconds
+                start = weekday * MINUTES_PER_DAY + start_time.hour * 60 + start_time.minute
+                end = weekday * MINUTES_PER_DAY + end_time.hour * 60 + end_time.minute
+                for idx in range(start, end + 1):
+                    in_class[idx >> 3] |= 1 << (idx & 7)
+        self._in_class = in_class
+    
+    def _is_in_class_fast(self, weekday: int, minute: int) -> int:
+        """Bit-test the minute-of-week bitmap (minute is minutes since midnight)"""
+        idx = weekday * MINUTES_PER_DAY + minute
+        return (self._in_class[idx >> 3] >> (idx & 7)) & 1
+    
+    def _find_class_at(self, current_time: time, weekday: int) -> Optional[Dict]:
+        """Return the first class whose period contains current_time on weekday, if any"""
+        # Most checks fall outside every class, which the bitmap answers alone
+        if not self._is_in_class_fast(weekday, current_time.hour * 60 + current_time.minute):
+            return None
+        
+        for start_time, end_time, class_info in self._class_periods.get(weekday, ()):
+            if start_time <= current_time <= end_time:
+                return class_info
+        return None
     
     def _create_default_schedule(self):
         """Create a default schedule if none exists"""
@@ -87,6 +140,8 @@ class ClassScheduler:
             }
         }
         
+        self._build_class_periods()
+        
         # Try to save default config
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
@@ -117,12 +172,9 @@ class ClassScheduler:
                 return False, f"Outside university hours ({current_time.strftime('%H:%M')})"
         
         # Check class schedule
-        if current_weekday in self.schedule_data.get('class_schedule', {}):
-            classes = self.schedule_data['class_schedule'][current_weekday]
-            
-            for class_info in classes:
-                if self._is_time_in_class_period(current_time, class_info):
-                    return False, f"During class: {class_info.get('name', 'Unknown')}"
+        class_info = self._find_class_at(current_time, current_weekday)
+        if class_info is not None:
+            return False, f"During class: {class_info.get('name', 'Unknown')}"
         
         return True, "Available time - no classes scheduled"
     
@@ -155,19 +207,7 @@ class ClassScheduler:
     def get_current_class_info(self) -> Optional[Dict]:
         """Get information about current class if any"""
         now = datetime.now()
-        current_time = now.time()
-        current_weekday = now.weekday()
-        
-        if current_weekday not in self.schedule_data.get('class_schedule', {}):
-            return None
-        
-        classes = self.schedule_data['class_schedule'][current_weekday]
-        
-        for class_info in classes:
-            if self._is_time_in_class_period(current_time, class_info):
-                return class_info
-        
-        return None
+        return self._find_class_at(now.time(), now.weekday())
     
     def get_next_class_info(self) -> Optional[Dict]:
         """Get information about next upcoming class"""
@@ -177,10 +217,7 @@ class ClassScheduler:
         
         # Check today's remaining classes
         if current_weekday in self.schedule_data.get('class_schedule', {}):
-            classes = self.schedule_data['class_schedule'][current_weekday]
-            
-            for class_info in classes:
-                start_time = self._parse_time(class_info.get('start', '00:00'))
+            for start_time, _, class_info in self._class_periods.get(current_weekday, ()):
                 if start_time > current_time:
                     return class_info
         
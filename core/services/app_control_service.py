@@ -159,35 +159,105 @@ class AppControlService:
             self.logger.error(f"Error adding content to note: {str(e)}")
             return False, f"Error adding content to note: {str(e)}"
     
-    def list_notes(self) -> Tuple[bool, List[str]]:
+    # separator element placed between query results in a batched script
+    _NOTE_QUERY_SEPARATOR = "---nova-note-query---"
+    
+    def _note_query_statements(self, query: str, params: Dict[str, Any], var: str) -> str:
         """
-        list all notes in the notes app
+        build applescript statements (run inside `tell account "iCloud"`)
+        that store the note titles for one query in `var`
         
+        args:
+            query: "list" (optional "limit") or "find" ("search_term")
+            params: the query's parameters
+            var: applescript variable to store the list of titles in
+            
         returns:
-            tuple[bool, list[str]]: success status and list of note titles
+            str: the applescript statements
         """
-        try:
-            # applescript to list all notes
-            script = '''
+        if query == "list":
+            limit = params.get("limit")
+            if limit is None:
+                return f"set {var} to name of every note"
+            # clamp to how many notes there are, since "notes 1 thru n" fails past the end
+            return f'''set noteCount to count of notes
+                    if noteCount > {int(limit)} then set noteCount to {int(limit)}
+                    if noteCount < 1 then
+                        set {var} to {{}}
+                    else
+                        set {var} to name of notes 1 thru noteCount
+                    end if'''
+        if query == "find":
+            # escape quotes in search term for applescript
+            search_term_escaped = params["search_term"].replace('"', '\\"')
+            return f'set {var} to name of every note where name contains "{search_term_escaped}"'
+        raise ValueError(f"unknown note query: {query}")
+    
+    def _run_note_queries(self, queries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[bool, List[List[str]], str]:
+        """
+        run one or more note title queries in a single osascript process
+        
+        args:
+            queries: (query, params) pairs, see _note_query_statements
+            
+        returns:
+            tuple[bool, list[list[str]], str]: success status, the titles for
+            each query in input order, and the error output on failure
+        """
+        statements = []
+        result_vars = []
+        for i, (query, params) in enumerate(queries):
+            var = f"queryResult{i}"
+            statements.append(self._note_query_statements(query, params, var))
+            result_vars.append(var)
+        
+        statement_block = "\n                    ".join(statements)
+        
+        # join the results into one list with a separator element between them
+        separator = f' & {{"{self._NOTE_QUERY_SEPARATOR}"}} & '
+        script = f'''
             tell application "Notes"
                 tell account "iCloud"
-                    set noteList to name of every note
-                    return noteList
+                    {statement_block}
+                    return {separator.join(result_vars)}
                 end tell
             end tell
             '''
-            
-            # run the applescript
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to list notes: {result.stderr}")
+        
+        # run the applescript
+        result = subprocess.run(['osascript', '-e', script], 
+                              capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            return False, [], result.stderr
+        
+        # parse the output: osascript prints the list as "a, b, <sep>, c"
+        results = [[]]
+        output = result.stdout.strip()
+        for name in (output.split(", ") if output else []):
+            if name == self._NOTE_QUERY_SEPARATOR:
+                results.append([])
+            else:
+                results[-1].append(name)
+        return True, results, ""
+    
+    def list_notes(self, limit: Optional[int] = None) -> Tuple[bool, List[str]]:
+        """
+        list notes in the notes app
+        
+        args:
+            limit: if given, only the first `limit` notes are fetched, so
+                notes app doesn't have to send every title
+        
+        returns:
+            tuple[bool, list[str]]: success status and list of note titles
+        """
+        try:
+            success, results, error = self._run_note_queries([("list", {"limit": limit})])
+            if not success:
+                self.logger.error(f"Failed to list notes: {error}")
                 return False, []
-            
-            # parse the output
-            notes = result.stdout.strip().split(", ")
-            return True, notes
+            return True, results[0]
             
         except Exception as e:
             self.logger.error(f"Error listing notes: {str(e)}")
@@ -204,35 +274,39 @@ class AppControlService:
             tuple[bool, list[str]]: success status and list of matching note titles
         """
         try:
-            # escape quotes in search term for applescript
-            search_term_escaped = search_term.replace('"', '\\"')
-            
-            # applescript to find notes matching the search term
-            script = f'''
-            tell application "Notes"
-                tell account "iCloud"
-                    set matchingNotes to name of every note where name contains "{search_term_escaped}"
-                    return matchingNotes
-                end tell
-            end tell
-            '''
+            success, results, error = self._run_note_queries([("find", {"search_term": search_term})])
+            if not success:
+                self.logger.error(f"Failed to find notes: {error}")
+                return False, []
+            return True, results[0]
             
-            # run the applescript
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+        except Exception as e:
+            self.logger.error(f"Error finding notes: {str(e)}")
+            return False, []
+    
+    def batch_note_queries(self, queries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[bool, List[List[str]]]:
+        """
+        run several read-only note queries with a single osascript call
+        
+        each query is ("list", {"limit": n}) or ("find", {"search_term": s}),
+        with the same meaning as list_notes and find_note.
+        
+        args:
+            queries: (query, params) pairs
             
-            if result.returncode != 0:
-                self.logger.error(f"Failed to find notes: {result.stderr}")
+        returns:
+            tuple[bool, list[list[str]]]: success status and the note titles
+            for each query, in input order
+        """
+        try:
+            success, results, error = self._run_note_queries(queries)
+            if not success:
+                self.logger.error(f"Failed to run note queries: {error}")
                 return False, []
-            
-            # parse the output
-            notes = result.stdout.strip().split(", ")
-            if notes == [""]:  # no matches
-                return True, []
-            return True, notes
+            return True, results
             
         except Exception as e:
-            self.logger.error(f"Error finding notes: {str(e)}")
+            self.logger.error(f"Error running note queries: {str(e)}")
             return False, []
             
     def set_focus_mode(self, mode: str) -> Tuple[bool, str]:
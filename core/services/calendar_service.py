@@ -5,10 +5,11 @@ This service combines class schedule from personal_config with
 calendar events from Google Calendar (preferred) or Notion to provide 
 a unified view of the user's schedule.
 """
+import asyncio
 import datetime
 import os
 import sys
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 
 # Add the core directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -78,58 +79,53 @@ class CalendarService:
         
         # Add class schedule from personal config
         weekday = date.strftime("%A")
-        for course in config.courses:
-            if weekday in course.get("days", []):
-                class_event = CalendarEvent.from_class_info(course, date)
-                day.add_event(class_event)
+        for course in config.courses_by_day.get(weekday, ()):
+            class_event = CalendarEvent.from_class_info(course, date)
+            day.add_event(class_event)
         
-        # Add activities from personal config
-        for activity in config.activities:
-            frequency = activity.get("frequency", "")
-            activity_days = activity.get("days", [])
+        # Add activities from personal config (daily ones are in every day's list)
+        for activity in config.activities_by_day.get(weekday, ()):
+            # Create an event for this activity
+            start_time = None
+            end_time = None
             
-            if frequency == "daily" or weekday in activity_days:
-                # Create an event for this activity
-                start_time = None
-                end_time = None
-                
-                # Parse time if available
-                time_str = activity.get("time", "")
-                if " - " in time_str:
-                    time_parts = time_str.split(" - ")
-                    if len(time_parts) == 2:
-                        # Convert to ISO format
-                        try:
-                            # Parse start time
-                            start_str = time_parts[0].strip()
-                            if "pm" in start_str.lower() and not start_str.startswith("12"):
-                                hour = int(start_str.split(":")[0]) + 12
-                                start_str = f"{hour}:{start_str.split(':')[1].split(' ')[0]}"
-                            else:
-                                start_str = start_str.split(' ')[0]
-                            
-                            # Parse end time
-                            end_str = time_parts[1].strip()
-                            if "pm" in end_str.lower() and not end_str.startswith("12"):
-                                hour = int(end_str.split(":")[0]) + 12
-                                end_str = f"{hour}:{end_str.split(':')[1].split(' ')[0]}"
-                            else:
-                                end_str = end_str.split(' ')[0]
-                            
-                            # Create ISO format datetime strings
-                            start_time = f"{date.isoformat()}T{start_str}:00"
-                            end_time = f"{date.isoformat()}T{end_str}:00"
-                        except Exception as e:
-                            print(f"Error parsing activity time: {e}")
-                
-                activity_event = CalendarEvent(
-                    title=activity.get("name", "Activity"),
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=activity.get("location"),
-                    event_type="activity"
-                )
-                day.add_event(activity_event)
+            # Parse time if available
+            time_str = activity.get("time", "")
+            if " - " in time_str:
+                time_parts = time_str.split(" - ")
+                if len(time_parts) == 2:
+                    # Convert to ISO format
+                    try:
+                        # Parse start time
+                        start_str = time_parts[0].strip()
+                        if "pm" in start_str.lower() and not start_str.startswith("12"):
+                            hour = int(start_str.split(":")[0]) + 12
+                            start_str = f"{hour}:{start_str.split(':')[1].split(' ')[0]}"
+                        else:
+                            start_str = start_str.split(' ')[0]
+                        
+                        # Parse end time
+                        end_str = time_parts[1].strip()
+                        if "pm" in end_str.lower() and not end_str.startswith("12"):
+                            hour = int(end_str.split(":")[0]) + 12
+                            end_str = f"{hour}:{end_str.split(':')[1].split(' ')[0]}"
+                        else:
+                            end_str = end_str.split(' ')[0]
+                        
+                        # Create ISO format datetime strings
+                        start_time = f"{date.isoformat()}T{start_str}:00"
+                        end_time = f"{date.isoformat()}T{end_str}:00"
+                    except Exception as e:
+                        print(f"Error parsing activity time: {e}")
+            
+            activity_event = CalendarEvent(
+                title=activity.get("name", "Activity"),
+                start_time=start_time,
+                end_time=end_time,
+                location=activity.get("location"),
+                event_type="activity"
+            )
+            day.add_event(activity_event)
         
         # Add Google Calendar events if available
         if self.google_calendar:
@@ -181,18 +177,39 @@ class CalendarService:
         tomorrow = datetime.date.today() + datetime.timedelta(days=1)
         return self.get_day_schedule(tomorrow)
     
-    def get_week_schedule(self) -> List[CalendarDay]:
-        """Get the schedule for the next 7 days"""
-        today = datetime.date.today()
-        return [self.get_day_schedule(today + datetime.timedelta(days=i)) for i in range(7)]
+    def get_week_schedule(self, dates: Optional[Sequence[datetime.date]] = None) -> List[CalendarDay]:
+        """Get the schedule for the next 7 days (or for `dates`, if the caller
+        already has them)"""
+        if dates is None:
+            today = datetime.date.today()
+            dates = [today + datetime.timedelta(days=i) for i in range(7)]
+        return [self.get_day_schedule(date) for date in dates]
+    
+    # Async variants run the blocking fetch in a worker thread, so callers can
+    # gather several schedules and wait for the slowest instead of the sum
+    async def get_today_schedule_async(self) -> CalendarDay:
+        """Get today's schedule without blocking the event loop"""
+        return await asyncio.to_thread(self.get_today_schedule)
+    
+    async def get_tomorrow_schedule_async(self) -> CalendarDay:
+        """Get tomorrow's schedule without blocking the event loop"""
+        return await asyncio.to_thread(self.get_tomorrow_schedule)
+    
+    async def get_week_schedule_async(self, dates: Optional[Sequence[datetime.date]] = None) -> List[CalendarDay]:
+        """Get the next 7 days' schedule without blocking the event loop"""
+        return await asyncio.to_thread(self.get_week_schedule, dates)
         
-    def get_rest_of_day_schedule(self) -> List[CalendarEvent]:
-        """Get events for the rest of the current day"""
-        today = datetime.date.today()
+    def get_rest_of_day_schedule(self, day: Optional[CalendarDay] = None) -> List[CalendarEvent]:
+        """Get events for the rest of the current day
+        
+        Pass today's already-fetched CalendarDay as `day` to filter it instead
+        of fetching the schedule again.
+        """
         now = datetime.datetime.now()
         
         # Get today's schedule
-        day = self.get_day_schedule(today)
+        if day is None:
+            day = self.get_day_schedule(datetime.date.today())
         events = day.get_sorted_events()
         
         # Filter for events that haven't started yet or are currently ongoing
@@ -270,9 +287,14 @@ class CalendarService:
             
             return response
     
-    def format_rest_of_day_schedule(self) -> str:
-        """Format the rest of day's schedule for conversational response"""
-        events = self.get_rest_of_day_schedule()
+    def format_rest_of_day_schedule(self, events: Optional[List[CalendarEvent]] = None) -> str:
+        """Format the rest of day's schedule for conversational response
+        
+        `events` can be the result of an earlier get_rest_of_day_schedule()
+        call, to avoid fetching the schedule again.
+        """
+        if events is None:
+            events = self.get_rest_of_day_schedule()
         
         # Get current time period (morning, afternoon, evening, night)
         hour = datetime.datetime.now().hour
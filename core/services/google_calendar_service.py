@@ -5,12 +5,16 @@ This service provides access to Google Calendar events through the Google Calend
 It handles authentication, token management, and calendar event retrieval.
 """
 import os
+import asyncio
 import datetime
 import pickle
 import json
+import threading
 from typing import List, Dict, Any, Optional, Union
 import pytz
 
+import httplib2
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -44,6 +48,11 @@ class GoogleCalendarService:
         
         self.token_file = os.path.join(credentials_dir, 'google_token.pickle')
         self.service = None
+        self.credentials = None
+        
+        # httplib2 connections aren't thread-safe, so each thread that makes
+        # API calls gets its own authorized transport
+        self._thread_local = threading.local()
         self.timezone = config.timezone or 'America/New_York'
         
         # Try to authenticate
@@ -98,11 +107,20 @@ class GoogleCalendarService:
         # Build the service
         try:
             self.service = build('calendar', 'v3', credentials=creds)
+            self.credentials = creds
             print("✅ Google Calendar service initialized")
         except Exception as e:
             print(f"⚠️  Error building Google Calendar service: {e}")
             self.service = None
     
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get the authorized HTTP transport for the calling thread"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
     def get_calendar_events(self, start_date: datetime.date, 
                            end_date: Optional[datetime.date] = None) -> List[Dict[str, Any]]:
         """Get calendar events for a specific date range"""
@@ -123,21 +141,37 @@ class GoogleCalendarService:
         end_str = end_datetime.isoformat()
         
         try:
-            # Call the Calendar API
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=start_str,
-                timeMax=end_str,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            events = events_result.get('items', [])
+            # Call the Calendar API, following nextPageToken so long ranges
+            # aren't cut off at the first page; large pages keep that rare
+            http = self._thread_http()
+            events = []
+            page_token = None
+            while True:
+                events_result = self.service.events().list(
+                    calendarId='primary',
+                    timeMin=start_str,
+                    timeMax=end_str,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    maxResults=2500,
+                    pageToken=page_token
+                ).execute(http=http)
+                events.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
             
             return self._parse_events(events)
         except Exception as e:
             print(f"⚠️  Error retrieving Google Calendar events: {e}")
             return []
     
+    async def get_calendar_events_async(self, start_date: datetime.date,
+                                        end_date: Optional[datetime.date] = None) -> List[Dict[str, Any]]:
+        """Get calendar events for a date range without blocking the event loop"""
+        # Each worker thread gets its own HTTP transport (see _thread_http)
+        return await asyncio.to_thread(self.get_calendar_events, start_date, end_date)
+    
     def get_today_events(self) -> List[Dict[str, Any]]:
         """Get calendar events for today"""
         today = datetime.date.today()
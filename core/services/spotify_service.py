@@ -10,6 +10,7 @@ This module provides comprehensive Spotify control functionality:
 import os
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Tuple
 from .spotify_auth import SpotifyAuth
 
@@ -22,6 +23,11 @@ class SpotifyService:
         self.base_url = "https://api.spotify.com/v1"
         self.current_device_id = None
         
+        # Last successful playlists fetch, indexed by lowercased name, so name
+        # lookups don't re-download the list every time (refreshed on a miss)
+        self._playlists_cache = None
+        self._playlists_by_name = {}
+        
         # Default playlist for private mode (configurable)
         self.default_playlist = os.getenv('SPOTIFY_DEFAULT_PLAYLIST', 'Nightmode')
         
@@ -116,18 +122,50 @@ class SpotifyService:
         """Get user's playlists"""
         response = self._make_request('GET', '/me/playlists?limit=50')
         if response and 'items' in response:
-            return response['items']
+            playlists = response['items']
+            self._playlists_cache = playlists
+            # Keep the first playlist for each name, as the old linear scan did
+            by_name = {}
+            for playlist in playlists:
+                by_name.setdefault(playlist['name'].lower(), playlist)
+            self._playlists_by_name = by_name
+            return playlists
         return []
     
+    def prefetch_state(self) -> Dict[str, Any]:
+        """
+        Fetch the user profile, playlists and devices in parallel
+        
+        The three GETs are independent, so they are issued together and
+        cost one round trip instead of three. The playlists are cached for
+        find_playlist_by_name.
+        
+        Returns:
+            Dict with 'profile', 'playlists' and 'devices'
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            profile = executor.submit(self.get_user_profile)
+            playlists = executor.submit(self.get_user_playlists)
+            devices = executor.submit(self.get_available_devices)
+            
+            return {
+                'profile': profile.result(),
+                'playlists': playlists.result(),
+                'devices': devices.result()
+            }
+    
     def find_playlist_by_name(self, playlist_name: str) -> Optional[Dict]:
         """Find a playlist by name (case-insensitive)"""
-        playlists = self.get_user_playlists()
+        name = playlist_name.lower()
         
-        for playlist in playlists:
-            if playlist['name'].lower() == playlist_name.lower():
-                return playlist
+        # Try the cached index first; on a miss (or no cache yet) fetch the
+        # playlists again in case this one was created since
+        playlist = self._playlists_by_name.get(name)
+        if playlist is None:
+            self.get_user_playlists()
+            playlist = self._playlists_by_name.get(name)
         
-        return None
+        return playlist
     
     def start_playlist(self, playlist_name: str = None) -> bool:
         """Start playing a specific playlist"""
@@ -371,6 +409,8 @@ class SpotifyService:
         try:
             # Clear current device reference
             self.current_device_id = None
+            self._playlists_cache = None
+            self._playlists_by_name = {}
             
             # Clear auth reference
             if hasattr(self, 'auth'):
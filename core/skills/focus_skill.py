@@ -10,9 +10,35 @@ from typing import Optional, Tuple, Dict, Any
 
 from core.services.app_control_service import AppControlService
 
+def _combine_patterns(patterns: Dict[str, re.Pattern], order: Tuple[str, ...]) -> re.Pattern:
+    """Merge named patterns into one alternation whose group names are the intents"""
+    return re.compile('|'.join(f'(?P<{name}>{patterns[name].pattern})' for name in order), re.IGNORECASE)
+
 class FocusSkill:
     """Skill for handling focus mode commands"""
     
+    # Patterns for matching focus mode commands, compiled once at class load
+    # so per-request FocusSkill instances don't recompile them
+    patterns = {
+        'enable_dnd': re.compile(r'^(?:.*)?(?:enable|turn on|activate|set).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
+        'disable_dnd': re.compile(r'^(?:.*)?(?:disable|turn off|deactivate).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
+        'toggle_dnd': re.compile(r'^(?:.*)?(?:toggle|switch).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
+        'get_focus': re.compile(r'^(?:.*)?(?:what(?:\'s)?|which|get|check|is).*(?:my|the|if)?.*(?:focus mode|current focus|do not disturb|dnd).*(?:active|enabled|on|current|now|mode)?(?:\s|$|\.)', re.IGNORECASE),
+        'set_focus': re.compile(r'^(?:.*)?(?:set|change|switch).*(?:my|the).*focus.*(?:to|mode)(?:\s|$|\.)', re.IGNORECASE),
+        'private_mode': re.compile(r'^(?:.*)?(?:set|enable|turn on).*(?:private mode|privacy mode|home to private)(?:\s|$|\.)', re.IGNORECASE),
+        'disable_all_focus': re.compile(r'^(?:.*)?(?:disable|turn off|deactivate).*(?:all|every).*(?:focus|mode)(?:\s|$|\.)', re.IGNORECASE),
+        'set_dnd_mode': re.compile(r'^(?:.*)?(?:set).*(?:home|mode|mac|macbook).*(?:to).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
+    }
+    
+    # Intents in the order process() gives them priority. Every pattern is
+    # anchored at the start of the text, so the first alternative that matches
+    # is the first intent in this order that would have matched on its own.
+    _intent_order = ('enable_dnd', 'set_dnd_mode', 'disable_dnd', 'disable_all_focus',
+                     'toggle_dnd', 'get_focus', 'set_focus', 'private_mode')
+    
+    # All patterns merged into a single alternation so a command is scanned once
+    _combined = _combine_patterns(patterns, _intent_order)
+    
     def __init__(self, app_control_service: AppControlService):
         """
         Initialize the focus skill
@@ -23,18 +49,6 @@ class FocusSkill:
         self.logger = logging.getLogger("nova.skills.focus")
         self.app_control = app_control_service
         
-        # Patterns for matching focus mode commands
-        self.patterns = {
-            'enable_dnd': re.compile(r'^(?:.*)?(?:enable|turn on|activate|set).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
-            'disable_dnd': re.compile(r'^(?:.*)?(?:disable|turn off|deactivate).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
-            'toggle_dnd': re.compile(r'^(?:.*)?(?:toggle|switch).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
-            'get_focus': re.compile(r'^(?:.*)?(?:what(?:\'s)?|which|get|check|is).*(?:my|the|if)?.*(?:focus mode|current focus|do not disturb|dnd).*(?:active|enabled|on|current|now|mode)?(?:\s|$|\.)', re.IGNORECASE),
-            'set_focus': re.compile(r'^(?:.*)?(?:set|change|switch).*(?:my|the).*focus.*(?:to|mode)(?:\s|$|\.)', re.IGNORECASE),
-            'private_mode': re.compile(r'^(?:.*)?(?:set|enable|turn on).*(?:private mode|privacy mode|home to private)(?:\s|$|\.)', re.IGNORECASE),
-            'disable_all_focus': re.compile(r'^(?:.*)?(?:disable|turn off|deactivate).*(?:all|every).*(?:focus|mode)(?:\s|$|\.)', re.IGNORECASE),
-            'set_dnd_mode': re.compile(r'^(?:.*)?(?:set).*(?:home|mode|mac|macbook).*(?:to).*(?:do not disturb|dnd)(?:\s|$|\.)', re.IGNORECASE),
-        }
-        
         # Map of focus mode names for recognition
         self.focus_modes = {
             'do not disturb': 'Do Not Disturb',
@@ -60,7 +74,7 @@ class FocusSkill:
         Returns:
             bool: True if the text matches a focus mode command pattern, False otherwise
         """
-        return any(pattern.search(text) for pattern in self.patterns.values())
+        return self._combined.search(text) is not None
     
     def process(self, text: str) -> str:
         """
@@ -74,33 +88,36 @@ class FocusSkill:
         """
         self.logger.info(f"Processing focus mode command: {text}")
         
+        match = self._combined.search(text)
+        intent = match.lastgroup if match else None
+        
         # Check for enable DND command
-        if self.patterns['enable_dnd'].search(text):
+        if intent == 'enable_dnd':
             success, message = self.app_control.set_do_not_disturb(True)
             return "I've turned on Do Not Disturb mode." if success else f"Sorry, I couldn't turn on Do Not Disturb: {message}"
         
         # Check for specific "set home/mode to DND" command
-        if self.patterns['set_dnd_mode'].search(text):
+        if intent == 'set_dnd_mode':
             success, message = self.app_control.set_do_not_disturb(True)
             return "I've set your home to private mode." if success else f"Sorry, I couldn't set private mode: {message}"
         
         # Check for disable DND command
-        if self.patterns['disable_dnd'].search(text):
+        if intent == 'disable_dnd':
             success, message = self.app_control.set_do_not_disturb(False)
             return "I've turned off Do Not Disturb mode." if success else f"Sorry, I couldn't turn off Do Not Disturb: {message}"
         
         # Check for disable all focus modes command
-        if self.patterns['disable_all_focus'].search(text):
+        if intent == 'disable_all_focus':
             success, message = self.app_control.set_do_not_disturb(False)
             return "I've turned off all focus modes." if success else f"Sorry, I couldn't turn off focus modes: {message}"
         
         # Check for toggle DND command
-        if self.patterns['toggle_dnd'].search(text):
+        if intent == 'toggle_dnd':
             success, message = self.app_control.toggle_do_not_disturb()
             return f"I've toggled Do Not Disturb mode." if success else f"Sorry, I couldn't toggle Do Not Disturb: {message}"
         
         # Check for get focus command
-        if self.patterns['get_focus'].search(text):
+        if intent == 'get_focus':
             success, mode = self.app_control.get_current_focus_mode()
             if success:
                 if not mode or mode.lower() == "none":
@@ -110,7 +127,7 @@ class FocusSkill:
                 return f"Sorry, I couldn't check your focus mode: {mode}"
         
         # Check for set focus command
-        if self.patterns['set_focus'].search(text) or self.patterns['private_mode'].search(text):
+        if intent in ('set_focus', 'private_mode'):
             # Extract the focus mode from the command
             focus_mode = self._extract_focus_mode(text)
             
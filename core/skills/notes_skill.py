@@ -144,8 +144,8 @@ class NotesSkill:
         match = re.search(add_to_recent_pattern, query_lower)
         if match:
             content = match.group(1).strip()
-            # get all notes to find the most recent one
-            success, notes = self.app_control.list_notes()
+            # only the most recent note is needed
+            success, notes = self.app_control.list_notes(limit=1)
             if success and notes:
                 # add content to the most recent note (first in the list)
                 note_title = notes[0]
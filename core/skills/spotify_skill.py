@@ -9,12 +9,17 @@ This skill handles all Spotify-related commands including:
 """
 import re
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from core.services.spotify_service import SpotifyService
 
 class SpotifySkill:
     """Skill for handling Spotify music commands"""
     
+    # Command categories that only read state and never change playback
+    READ_ONLY_CATEGORIES = frozenset({
+        'whats_playing', 'playlist_info', 'playlist_details', 'music_help'
+    })
+    
     def __init__(self, spotify_service: SpotifyService):
         """Initialize Spotify skill with service"""
         self.spotify = spotify_service
@@ -177,49 +182,51 @@ class SpotifySkill:
                 return "I'm sorry, but I can't access Spotify right now. Please make sure you're authenticated with Spotify first."
             
             # Determine command type and execute
-            if self._matches_pattern(text, 'play_music'):
+            category = self.get_command_category(text)
+            
+            if category == 'play_music':
                 return self._handle_play_music()
             
-            elif self._matches_pattern(text, 'play_playlist'):
+            elif category == 'play_playlist':
                 playlist_name = self._extract_playlist_name(text)
                 return self._handle_play_playlist(playlist_name)
             
-            elif self._matches_pattern(text, 'pause_music'):
+            elif category == 'pause_music':
                 return self._handle_pause_music()
             
-            elif self._matches_pattern(text, 'resume_music'):
+            elif category == 'resume_music':
                 return self._handle_resume_music()
             
-            elif self._matches_pattern(text, 'next_track'):
+            elif category == 'next_track':
                 return self._handle_next_track()
             
-            elif self._matches_pattern(text, 'previous_track'):
+            elif category == 'previous_track':
                 return self._handle_previous_track()
             
-            elif self._matches_pattern(text, 'volume_up'):
+            elif category == 'volume_up':
                 return self._handle_volume_up()
             
-            elif self._matches_pattern(text, 'volume_down'):
+            elif category == 'volume_down':
                 return self._handle_volume_down()
             
-            elif self._matches_pattern(text, 'set_volume'):
+            elif category == 'set_volume':
                 volume = self._extract_volume(text)
                 return self._handle_set_volume(volume)
             
-            elif self._matches_pattern(text, 'whats_playing'):
+            elif category == 'whats_playing':
                 return self._handle_whats_playing()
             
-            elif self._matches_pattern(text, 'playlist_info'):
+            elif category == 'playlist_info':
                 return self._handle_playlist_info()
             
-            elif self._matches_pattern(text, 'playlist_details'):
+            elif category == 'playlist_details':
                 playlist_name = self._extract_playlist_name(text)
                 return self._handle_playlist_details(playlist_name)
             
-            elif self._matches_pattern(text, 'context_music'):
+            elif category == 'context_music':
                 return self._handle_context_music(text)
             
-            elif self._matches_pattern(text, 'music_help'):
+            elif category == 'music_help':
                 return self._handle_music_help()
             
             else:
@@ -229,6 +236,35 @@ class SpotifySkill:
             self.logger.error(f"Error processing Spotify command: {e}")
             return f"I encountered an error while processing your Spotify request: {str(e)}"
     
+    def get_command_category(self, text: str) -> Optional[str]:
+        """Return the command category process() would dispatch the text to
+        
+        Categories are checked in the order they are defined, so earlier
+        categories take precedence (e.g. 'play_music' over 'play_playlist').
+        """
+        text_lower = text.strip().lower()
+        for category, patterns in self.compiled_patterns.items():
+            for pattern in patterns:
+                if pattern.search(text_lower):
+                    return category
+        return None
+    
+    def get_request_key(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (category, playlist name) identifying the request behind the text
+        
+        Commands with the same key make the same Spotify call, e.g. "What
+        playlists do I have?" and "Show me my playlists". Only playlist
+        commands depend on the wording, so the name is None for the others.
+        """
+        category = self.get_command_category(text)
+        if category in ('play_playlist', 'playlist_details'):
+            return category, self._extract_playlist_name(text.strip())
+        return category, None
+    
+    def is_read_only_command(self, text: str) -> bool:
+        """Check if the command only queries Spotify without changing playback"""
+        return self.get_command_category(text) in self.READ_ONLY_CATEGORIES
+    
     def _matches_pattern(self, text: str, category: str) -> bool:
         """Check if text matches a specific pattern category"""
         if category not in self.compiled_patterns:
@@ -8,6 +8,20 @@ from typing import List, Dict, Any
 from datetime import datetime, time
 
 
+# Anything the markdown, time, number/symbol, abbreviation or punctuation
+# passes could rewrite: digits, markdown and math symbols, quote pairs,
+# brackets, repeated punctuation and (a superset of) the abbreviations.
+# Text with none of these only needs its whitespace cleaned up.
+_NEEDS_FULL_PASS = re.compile(
+    r"[\d*`#•\-+=<>/$%;:\"()\[\]{}]"
+    r"|[!?.]{2}"
+    r"|'[^']*'"
+    r"|\b(?:csc|fmst|ur|uofr|ny|ca|usa|phd|mba|bs|ms|vs|etc|i\.e|e\.g"
+    r"|dr|mr|mrs|prof|st|ave|blvd|rd|ln|ct|pl)\b",
+    re.IGNORECASE
+)
+
+
 class TextProcessor:
     """Processes text to make it natural and speakable"""
     
@@ -16,6 +30,11 @@ class TextProcessor:
         """Main method to process text for natural speech output"""
         if not text:
             return text
+        
+        # Plain prose (most replies) would pass through every stage but the
+        # last unchanged, so skip straight to it
+        if not _NEEDS_FULL_PASS.search(text):
+            return TextProcessor._clean_whitespace(text)
             
         # Process in order of priority
         text = TextProcessor._clean_markdown(text)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Time Greeting for Nova - Greeting for each hour of the day, as lookup tables
+"""
+
+# Conversational greeting indexed by hour (0-23): night until 5, morning
+# until noon, afternoon until 5 PM, evening until 9 PM, then night again
+TIME_GREETINGS = (
+    ("Good night",) * 5 +
+    ("Good morning",) * 7 +
+    ("Good afternoon",) * 5 +
+    ("Good evening",) * 4 +
+    ("Good night",) * 3
+)
+
+# Welcome-home greeting indexed by hour (0-23): Nova never says "Good night"
+# when greeting, so anything outside morning and afternoon is evening
+WELCOME_GREETINGS = (
+    ("Good evening",) * 5 +
+    ("Good morning",) * 7 +
+    ("Good afternoon",) * 5 +
+    ("Good evening",) * 7
+)
+
+
+def get_time_greeting(hour: int) -> str:
+    """Get the conversational greeting for an hour of the day (0-23)"""
+    return TIME_GREETINGS[hour]
+
+
+def get_welcome_greeting(hour: int) -> str:
+    """Get the welcome-home greeting for an hour of the day (0-23)"""
+    return WELCOME_GREETINGS[hour]
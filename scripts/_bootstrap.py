@@ -0,0 +1,13 @@
+"""
+Path setup shared by Nova's scripts
+
+Importing this module puts the project root on sys.path (once) so scripts
+run as `python scripts/<name>.py` can import the `core` package.
+"""
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
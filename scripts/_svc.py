@@ -0,0 +1,91 @@
+"""
+Shared service instances and helpers for Nova's test scripts
+
+Scripts that need an AppControlService, NovaBrain, SpotifyService or
+NotionClient import the cached factory from here, so when several test
+functions or scripts run in one Python process (a runner, pytest, an
+interactive session) each is only constructed (and authenticated) once.
+"""
+import contextlib
+import functools
+import io
+import sys
+import time
+
+import _bootstrap  # noqa: F401
+
+@functools.lru_cache(maxsize=1)
+def app_control():
+    """Return the process-wide AppControlService, creating it on first use"""
+    from core.services.app_control_service import AppControlService
+    return AppControlService()
+
+@functools.lru_cache(maxsize=1)
+def brain():
+    """Return the process-wide NovaBrain, creating it on first use"""
+    from core.brain.router import NovaBrain
+    return NovaBrain()
+
+@functools.lru_cache(maxsize=1)
+def spotify():
+    """Return the process-wide SpotifyService, creating it on first use"""
+    from core.services.spotify_service import SpotifyService
+    return SpotifyService()
+
+@functools.lru_cache(maxsize=1)
+def notion_client():
+    """Return the process-wide NotionClient, creating it on first use"""
+    from core.integrations.notion_client import NotionClient
+    return NotionClient()
+
+def wait_for_focus_change(service, previous, timeout: float = 2.0, interval: float = 0.05):
+    """
+    Poll `service.get_current_focus_mode()` until it reports something other
+    than `previous`, or until `timeout` seconds have passed.
+    
+    Works with anything exposing get_current_focus_mode() -> (success, mode),
+    i.e. AppControlService and FocusController.
+    
+    Returns:
+        The last mode observed (may equal `previous` on timeout)
+    """
+    deadline = time.monotonic() + timeout
+    current = previous
+    while time.monotonic() < deadline:
+        success, mode = service.get_current_focus_mode()
+        if success:
+            current = mode
+            if current != previous:
+                break
+        time.sleep(interval)
+    return current
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """
+    Collect everything printed inside the block and write it to stdout in
+    one go when the block exits (also on error), instead of one write per
+    print.
+    
+    Only use it around output that doesn't need to be seen live, i.e. not
+    around anything that prompts the user.
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+def line_buffered_stdout():
+    """
+    Flush stdout at every newline, so a long test piped into tee or a log
+    file shows each line as it's printed rather than in block-sized bursts.
+    
+    Does nothing if stdout has been replaced by something that can't be
+    reconfigured.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=True)
@@ -11,6 +11,9 @@ import pickle
 from pathlib import Path
 import webbrowser
 
+# Project root (parent of the scripts directory)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
@@ -35,7 +38,7 @@ def debug_auth():
     
     # Use the credentials file directly
     # Look for any client_secret file in the credentials directory
-    credentials_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'credentials')
+    credentials_dir = os.path.join(PROJECT_ROOT, 'credentials')
     client_secret_files = [f for f in os.listdir(credentials_dir) if f.startswith('client_secret') and f.endswith('.json')]
     if not client_secret_files:
         print("❌ No client_secret*.json file found in credentials directory")
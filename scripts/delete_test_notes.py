@@ -3,12 +3,10 @@ delete test notes created during development
 
 this script deletes test notes created during development to clean up the notes app.
 """
-import sys
-import os
 import subprocess
 
-# add the project root to python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 def delete_note(note_title):
     """delete a note with the specified title"""
@@ -4,11 +4,9 @@ interactive text mode for nova
 this script allows you to interact with nova using text commands
 without requiring voice input or wake word detection.
 """
-import sys
-import os
 
-# add the project root to python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # import the brain directly
 from core.brain import NovaBrain
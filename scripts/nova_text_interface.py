@@ -7,10 +7,69 @@ Type your commands and see Nova's responses in real-time.
 """
 
 import sys
-import os
+import asyncio
+import threading
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+EXIT_COMMANDS = ('exit', 'quit', 'bye')
+
+def _read_commands(loop, commands):
+    """Read lines from stdin on a daemon thread and hand them to the event loop"""
+    while True:
+        try:
+            line = input("\n🎤 You: ").strip()
+        except (EOFError, KeyboardInterrupt):
+            line = 'exit'
+        loop.call_soon_threadsafe(commands.put_nowait, line)
+        if line.lower() in EXIT_COMMANDS:
+            return
+
+async def _respond(brain, commands):
+    """Process queued commands one at a time, off the event loop"""
+    while True:
+        user_input = await commands.get()
+        try:
+            response = await asyncio.to_thread(brain.process_input, user_input)
+            print(f"🎵 Nova: {response}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            print("Please try again or type 'exit' to quit.")
+        finally:
+            commands.task_done()
+
+async def _command_loop(brain):
+    """
+    Dispatch user commands to Nova without blocking the prompt.
+    
+    Input is read on its own thread so the next command can be typed while
+    the previous one is still being processed (LLM/Spotify calls); commands
+    are still handled in the order they were entered.
+    """
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
+    pending = asyncio.Queue()
+    threading.Thread(target=_read_commands, args=(loop, lines), daemon=True).start()
+    responder = asyncio.create_task(_respond(brain, pending))
+    
+    try:
+        while True:
+            user_input = await lines.get()
+            
+            # Check for exit
+            if user_input.lower() in EXIT_COMMANDS:
+                await pending.join()
+                print("👋 Goodbye! Nova signing off...")
+                break
+            
+            if not user_input:
+                continue
+            
+            print("🧠 Nova: Processing...")
+            pending.put_nowait(user_input)
+    finally:
+        responder.cancel()
 
 def main():
     """Main text interface for Nova"""
@@ -36,32 +95,10 @@ def main():
         print("\n" + "=" * 50)
         
         # Main command loop
-        while True:
-            try:
-                # Get user input
-                user_input = input("\n🎤 You: ").strip()
-                
-                # Check for exit
-                if user_input.lower() in ['exit', 'quit', 'bye']:
-                    print("👋 Goodbye! Nova signing off...")
-                    break
-                
-                if not user_input:
-                    continue
-                
-                # Process command through Nova
-                print("🧠 Nova: Processing...")
-                response = brain.process_input(user_input)
-                
-                # Display response
-                print(f"🎵 Nova: {response}")
-                
-            except KeyboardInterrupt:
-                print("\n\n👋 Goodbye! Nova signing off...")
-                break
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                print("Please try again or type 'exit' to quit.")
+        try:
+            asyncio.run(_command_loop(brain))
+        except KeyboardInterrupt:
+            print("\n\n👋 Goodbye! Nova signing off...")
                 
     except Exception as e:
         print(f"❌ Failed to initialize Nova: {e}")
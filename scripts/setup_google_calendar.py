@@ -19,31 +19,37 @@ import pickle
 from pathlib import Path
 import webbrowser
 import time
+from types import SimpleNamespace
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+from _bootstrap import PROJECT_ROOT
 
-try:
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
-    from google.oauth2.credentials import Credentials
-except ImportError:
-    print("⚠️  Required Google packages not found. Installing...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", 
-                         "google-api-python-client", "google-auth-httplib2", "google-auth-oauthlib"])
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
-    from google.oauth2.credentials import Credentials
+def _lazy_import_google():
+    """Import the Google auth/API packages on first use, installing them if missing"""
+    try:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        from google.oauth2.credentials import Credentials
+    except ImportError:
+        print("⚠️  Required Google packages not found. Installing...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", 
+                             "google-api-python-client", "google-auth-httplib2", "google-auth-oauthlib"])
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        from google.oauth2.credentials import Credentials
+    
+    return SimpleNamespace(InstalledAppFlow=InstalledAppFlow, Request=Request,
+                           build=build, Credentials=Credentials)
 
 # Define the scopes needed for Google Calendar API
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
 def create_credentials_dir():
     """Create credentials directory if it doesn't exist"""
-    credentials_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'credentials')
+    credentials_dir = os.path.join(PROJECT_ROOT, 'credentials')
     os.makedirs(credentials_dir, exist_ok=True)
     return credentials_dir
 
@@ -110,10 +116,11 @@ def setup_google_calendar():
     
     # Step 3: Authenticate with Google Calendar API
     print("\n🔑 Now we'll authenticate with Google Calendar...")
+    google = _lazy_import_google()
     
     try:
         # Create the flow from client secrets file
-        flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
+        flow = google.InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
         creds = flow.run_local_server(port=0)
         
         # Save the credentials for future use
@@ -129,7 +136,7 @@ def setup_google_calendar():
     print("\n🧪 Testing connection to Google Calendar...")
     
     try:
-        service = build('calendar', 'v3', credentials=creds)
+        service = google.build('calendar', 'v3', credentials=creds)
         
         # Get upcoming events
         now = time.strftime('%Y-%m-%dT%H:%M:%S%z')
@@ -10,23 +10,30 @@ import json
 import pickle
 import webbrowser
 from pathlib import Path
+from types import SimpleNamespace
 
-try:
-    import google.auth
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
-except ImportError:
-    print("Installing required packages...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", 
-                         "google-api-python-client", "google-auth-httplib2", "google-auth-oauthlib"])
-    import google.auth
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
+# Project root (parent of the scripts directory)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _lazy_import_google():
+    """Import the Google auth/API packages on first use, installing them if missing"""
+    try:
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+    except ImportError:
+        print("Installing required packages...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", 
+                             "google-api-python-client", "google-auth-httplib2", "google-auth-oauthlib"])
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+    
+    return SimpleNamespace(Credentials=Credentials, InstalledAppFlow=InstalledAppFlow,
+                           Request=Request, build=build)
 
 # Define the scopes needed for Google Calendar API
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
@@ -36,7 +43,7 @@ def simple_auth():
     print("\n🔑 Simple Google Calendar Authentication\n")
     
     # Paths for credentials and token
-    credentials_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'credentials')
+    credentials_dir = os.path.join(PROJECT_ROOT, 'credentials')
     # Look for any client_secret file in the credentials directory
     client_secret_files = [f for f in os.listdir(credentials_dir) if f.startswith('client_secret') and f.endswith('.json')]
     if not client_secret_files:
@@ -52,6 +59,9 @@ def simple_auth():
         print(f"⚠️  Credentials file not found at: {credentials_file}")
         return False
     
+    # Import the Google packages only once we know there is something to authenticate
+    google = _lazy_import_google()
+    
     creds = None
     
     # Check if token file exists and is valid
@@ -65,7 +75,7 @@ def simple_auth():
                 print("✅ Existing token is valid!")
             elif creds and creds.expired and creds.refresh_token:
                 print("🔄 Token expired, refreshing...")
-                creds.refresh(Request())
+                creds.refresh(google.Request())
                 print("✅ Token refreshed successfully!")
             else:
                 print("⚠️  Token invalid or expired without refresh token")
@@ -82,7 +92,7 @@ def simple_auth():
         os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'  # For development only
         
         try:
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
+            flow = google.InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
             
             # Try different authentication approaches
             print("\n📋 Choose authentication method:")
@@ -123,7 +133,7 @@ def simple_auth():
     # Test the connection
     print("\n🧪 Testing connection to Google Calendar...")
     try:
-        service = build('calendar', 'v3', credentials=creds)
+        service = google.build('calendar', 'v3', credentials=creds)
         calendar_list = service.calendarList().list().execute()
         calendars = calendar_list.get('items', [])
         
@@ -8,12 +8,11 @@ that might be misheard by the speech-to-text system.
 Usage:
     python scripts/test_app_control.py
 """
-import os
 import sys
 import re
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 try:
     from core.brain.router import NovaBrain
@@ -21,6 +20,10 @@ except ImportError as e:
     print(f"Error importing NovaBrain: {e}")
     sys.exit(1)
 
+# Fallback-detection vocabulary (sets for O(1) membership checks)
+APP_KEYWORDS = frozenset({'open', 'launch', 'start', 'run'})
+KNOWN_APPS = frozenset({'chrome', 'safari', 'firefox', 'browser', 'finder', 'terminal', 'calculator', 'calendar'})
+
 def test_app_control():
     """Test app control functionality"""
     print("\n🧪 Testing App Control functionality\n")
@@ -78,12 +81,11 @@ def test_app_control():
             
             # Check if fallback detection would work
             words = phrase.lower().split()
-            app_keywords = ['open', 'launch', 'start', 'run']
-            for i, word in enumerate(words):
-                if word in app_keywords and i < len(words) - 1:
+            for i in range(len(words) - 1):
+                if words[i] in APP_KEYWORDS:
                     potential_app = words[i+1]
                     print(f"  🔍 Potential app name detected: '{potential_app}'")
-                    if potential_app in ['chrome', 'safari', 'firefox', 'browser', 'finder', 'terminal', 'calculator', 'calendar']:
+                    if potential_app in KNOWN_APPS:
                         print(f"  ✅ Fallback detection would match: '{potential_app}'")
                         app_control_match = True
                         break
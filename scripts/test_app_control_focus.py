@@ -4,27 +4,24 @@ Test script for Focus Mode control via AppControlService
 
 This script tests the AppControlService's focus mode control functionality.
 """
-import sys
-import os
-import time
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Import the AppControlService
-from core.services.app_control_service import AppControlService
+# Import the shared AppControlService factory
+from _svc import app_control as shared_app_control, wait_for_focus_change
 
 def test_app_control_focus():
     """Test the AppControlService focus control functionality"""
     print("\n===== Testing AppControlService Focus Control =====\n")
     
-    # Create an AppControlService instance
-    service = AppControlService()
+    # Get the shared AppControlService instance
+    service = shared_app_control()
     
     # Test 1: Get current focus mode
     print("Test 1: Getting current focus mode...")
@@ -36,8 +33,8 @@ def test_app_control_focus():
     success, message = service.toggle_do_not_disturb()
     print(f"Result: {message}")
     
-    # Wait a moment to let the system update
-    time.sleep(2)
+    # Wait (up to 2s) for the system to report the new mode
+    wait_for_focus_change(service, current_mode)
     
     # Test 3: Get current focus mode again to verify the change
     print("\nTest 3: Verifying focus mode changed...")
@@ -51,11 +48,12 @@ def test_app_control_focus():
     
     # Test 5: Try setting a specific focus mode
     print("\nTest 5: Setting specific focus mode (Do Not Disturb)...")
+    _, mode_before = service.get_current_focus_mode()
     success, message = service.set_focus_mode("Do Not Disturb")
     print(f"Result: {message}")
     
-    # Wait a moment
-    time.sleep(2)
+    # Wait (up to 2s) for the mode to change
+    wait_for_focus_change(service, mode_before)
     
     # Test 6: Disable Do Not Disturb
     print("\nTest 6: Disabling Do Not Disturb...")
@@ -3,11 +3,57 @@
 Test script for Nova's audio cleanup functionality
 """
 
+import functools
 import os
 import time
 import tempfile
-import shutil
-from pathlib import Path
+import struct
+from operator import itemgetter
+
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+# Import the monitor once; both tests report the failure if it's unavailable
+# (sounddevice raises OSError when PortAudio is missing)
+try:
+    from core.audio.interruption_monitor import InterruptionMonitor
+    _MONITOR_IMPORT_ERROR = None
+except (ImportError, OSError) as e:
+    InterruptionMonitor = None
+    _MONITOR_IMPORT_ERROR = e
+
+# Canonical 44-byte PCM WAV header (mono, 16-bit, 44.1kHz)
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+@functools.lru_cache(maxsize=64)
+def _wav_header(data_size: int) -> bytes:
+    """Pack a WAV header for `data_size` bytes of PCM data"""
+    return _WAV_HEADER.pack(b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+                            44100, 44100 * 2, 2, 16, b'data', data_size)
+
+def _scan_wavs(directory: str, prefix: str = ""):
+    """List (name, mtime, size) for WAV files in `directory` with one stat per entry
+    
+    Names are filtered with plain prefix/suffix checks rather than a glob
+    pattern, so no Path objects or fnmatch regexes are built per entry.
+    """
+    with os.scandir(directory) as entries:
+        return [(entry.name, st.st_mtime, st.st_size)
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.wav')
+                for st in (entry.stat(),)]
+
+def _remove_flat_dir(directory: str):
+    """Remove a directory containing only regular files (no subdirectories)"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            os.unlink(entry.path)
+    os.rmdir(directory)
+
+@functools.lru_cache(maxsize=1)
+def _get_monitor():
+    """Create the InterruptionMonitor shared by both tests"""
+    return InterruptionMonitor()
 
 def create_test_audio_files(directory: str, count: int = 15):
     """Create test audio files with different timestamps"""
@@ -16,39 +62,37 @@ def create_test_audio_files(directory: str, count: int = 15):
     # Create directory if it doesn't exist
     os.makedirs(directory, exist_ok=True)
     
+    # Single time baseline so every file's age is relative to the same instant
+    now = time.time()
+    
     # Create files with different timestamps
     for i in range(count):
         # Create files with different ages (some old, some new)
         if i < 5:
             # Old files (more than 24 hours)
-            timestamp = time.time() - (25 * 3600) + i * 100
+            timestamp = now - (25 * 3600) + i * 100
         elif i < 10:
             # Medium files (12-24 hours)
-            timestamp = time.time() - (18 * 3600) + i * 100
+            timestamp = now - (18 * 3600) + i * 100
         else:
             # Recent files (less than 12 hours)
-            timestamp = time.time() - (6 * 3600) + i * 100
+            timestamp = now - (6 * 3600) + i * 100
         
         filename = f"interruption_test_{i:02d}.wav"
         filepath = os.path.join(directory, filename)
         
         # Create a dummy WAV file
-        with open(filepath, 'wb') as f:
-            # Minimal WAV header + some dummy data
-            f.write(b'RIFF')
-            f.write((36 + i * 1000).to_bytes(4, 'little'))  # File size
-            f.write(b'WAVE')
-            f.write(b'fmt ')
-            f.write((16).to_bytes(4, 'little'))  # Chunk size
-            f.write((1).to_bytes(2, 'little'))   # Audio format (PCM)
-            f.write((1).to_bytes(2, 'little'))   # Channels
-            f.write((44100).to_bytes(4, 'little'))  # Sample rate
-            f.write((44100 * 2).to_bytes(4, 'little'))  # Byte rate
-            f.write((2).to_bytes(2, 'little'))   # Block align
-            f.write((16).to_bytes(2, 'little'))  # Bits per sample
-            f.write(b'data')
-            f.write((i * 1000).to_bytes(4, 'little'))  # Data size
-            f.write(b'\x00' * (i * 1000))  # Dummy audio data
+        data_size = i * 1000
+        header = _wav_header(data_size)
+        # Minimal WAV header + silent data. Only the header is written; the
+        # file is then extended to full length, which reads back as zeros and
+        # is stored as a sparse hole on filesystems that support it.
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, header)
+            os.ftruncate(fd, len(header) + data_size)
+        finally:
+            os.close(fd)
         
         # Set the file modification time
         os.utime(filepath, (timestamp, timestamp))
@@ -72,52 +116,40 @@ def test_cleanup_functionality():
         
         # Show initial state
         print(f"\n📊 Initial state:")
-        files = list(Path(test_dir).glob("*.wav"))
+        files = _scan_wavs(test_dir)
         print(f"   Total files: {len(files)}")
         
-        # Import and test the cleanup functionality
-        try:
-            from core.audio.interruption_monitor import InterruptionMonitor
-            
-            # Create a monitor instance
-            monitor = InterruptionMonitor()
+        # Test the cleanup functionality
+        if InterruptionMonitor is None:
+            print(f"❌ Could not import InterruptionMonitor: {_MONITOR_IMPORT_ERROR}")
+            print("   This test requires Nova's core modules to be available")
+        else:
+            monitor = _get_monitor()
             
             # Test cleanup with different parameters
             print(f"\n🧹 Testing cleanup with max_files=5, max_age_hours=12:")
             
-            # Temporarily change the working directory to test the cleanup
-            original_cwd = os.getcwd()
-            os.chdir(test_dir)
-            
-            try:
-                deleted_count = monitor.cleanup_old_audio_files(
-                    max_files=5, 
-                    max_age_hours=12
-                )
-            finally:
-                os.chdir(original_cwd)
+            deleted_count = monitor.cleanup_old_audio_files(
+                max_files=5, 
+                max_age_hours=12,
+                directory=test_dir
+            )
             print(f"   Files deleted: {deleted_count}")
             
             # Show final state
-            remaining_files = list(Path(test_dir).glob("*.wav"))
+            remaining_files = _scan_wavs(test_dir)
             print(f"\n📊 Final state:")
             print(f"   Remaining files: {len(remaining_files)}")
             
             if remaining_files:
                 print("   Remaining files:")
-                for file in sorted(remaining_files):
-                    mtime = time.ctime(os.path.getmtime(file))
-                    size = os.path.getsize(file)
-                    print(f"     {file.name} - {mtime} - {size} bytes")
-            
-        except ImportError as e:
-            print(f"❌ Could not import InterruptionMonitor: {e}")
-            print("   This test requires Nova's core modules to be available")
+                for name, mtime, size in sorted(remaining_files):
+                    print(f"     {name} - {time.ctime(mtime)} - {size} bytes")
         
     finally:
         # Clean up test directory
         if os.path.exists(test_dir):
-            shutil.rmtree(test_dir)
+            _remove_flat_dir(test_dir)
             print(f"\n🧹 Cleaned up test directory: {test_dir}")
 
 def test_manual_cleanup():
@@ -129,47 +161,42 @@ def test_manual_cleanup():
         return
     
     # Count current files
-    files = list(Path("audio_cache").glob("interruption_*.wav"))
+    files = _scan_wavs("audio_cache", "interruption_")
     print(f"📊 Current audio_cache state:")
     print(f"   Total interruption files: {len(files)}")
     
     if files:
-        total_size = sum(os.path.getsize(f) for f in files)
+        total_size = sum(size for _, _, size in files)
         size_mb = total_size / (1024 * 1024)
         print(f"   Total size: {size_mb:.2f} MB")
         
-        # Show oldest and newest files
-        files_with_time = [(f, os.path.getmtime(f)) for f in files]
-        files_with_time.sort(key=lambda x: x[1])
-        
-        if len(files_with_time) >= 2:
-            oldest = files_with_time[0]
-            newest = files_with_time[-1]
-            print(f"   Oldest: {oldest[0].name} - {time.ctime(oldest[1])}")
-            print(f"   Newest: {newest[0].name} - {time.ctime(newest[1])}")
+        # Show oldest and newest files (mtimes come from the scan above)
+        if len(files) >= 2:
+            oldest = min(files, key=itemgetter(1))
+            newest = max(files, key=itemgetter(1))
+            print(f"   Oldest: {oldest[0]} - {time.ctime(oldest[1])}")
+            print(f"   Newest: {newest[0]} - {time.ctime(newest[1])}")
     
     # Test cleanup
-    try:
-        from core.audio.interruption_monitor import InterruptionMonitor
-        
-        monitor = InterruptionMonitor()
-        
-        print(f"\n🧹 Running cleanup (max_files=10, max_age_hours=24):")
-        deleted_count = monitor.cleanup_old_audio_files(max_files=10, max_age_hours=24)
+    if InterruptionMonitor is None:
+        print(f"❌ Could not import InterruptionMonitor: {_MONITOR_IMPORT_ERROR}")
+        return
+    
+    monitor = _get_monitor()
+    
+    print(f"\n🧹 Running cleanup (max_files=10, max_age_hours=24):")
+    deleted_count = monitor.cleanup_old_audio_files(max_files=10, max_age_hours=24)
+    
+    if deleted_count > 0:
+        print(f"✅ Cleanup complete: {deleted_count} files deleted")
         
-        if deleted_count > 0:
-            print(f"✅ Cleanup complete: {deleted_count} files deleted")
-            
-            # Show new state
-            remaining_files = list(Path("audio_cache").glob("interruption_*.wav"))
-            remaining_size = sum(os.path.getsize(f) for f in remaining_files)
-            remaining_size_mb = remaining_size / (1024 * 1024)
-            print(f"📊 New state: {len(remaining_files)} files, {remaining_size_mb:.2f} MB")
-        else:
-            print("✅ No files needed cleanup")
-            
-    except ImportError as e:
-        print(f"❌ Could not import InterruptionMonitor: {e}")
+        # Show new state
+        remaining_files = _scan_wavs("audio_cache", "interruption_")
+        remaining_size = sum(size for _, _, size in remaining_files)
+        remaining_size_mb = remaining_size / (1024 * 1024)
+        print(f"📊 New state: {len(remaining_files)} files, {remaining_size_mb:.2f} MB")
+    else:
+        print("✅ No files needed cleanup")
 
 if __name__ == "__main__":
     print("🎵 Nova Audio Cleanup Test")
@@ -4,21 +4,19 @@ Test script for creating a basketball players note
 This script directly uses the AppControlService to create a note
 about the top 5 basketball players of all time.
 """
-import sys
-import os
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Import the app control service
-from core.services.app_control_service import AppControlService
+from _svc import app_control as shared_app_control
 
 def main():
     """Create a note about top 5 basketball players"""
     print("\n=== Creating Basketball Players Note ===\n")
     
     # Initialize the app control service
-    app_control = AppControlService()
+    app_control = shared_app_control()
     
     # Define the note title
     title = "Top 5 Basketball Players of All Time"
@@ -5,16 +5,15 @@ Test Calendar Response Formatting
 This script tests the calendar response formatting without requiring audio input.
 It simulates a user asking about their calendar and shows how Nova would respond.
 """
-import os
 import sys
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 try:
-    from core.services.calendar_service import CalendarService
-    from core.services.google_calendar_service import GoogleCalendarService
+    from core.skills.calendar_skill import CalendarSkill
     from core.brain.router import NovaBrain
 except ImportError as e:
     print(f"Error importing required modules: {e}")
@@ -27,6 +26,10 @@ def test_calendar_responses():
     # Initialize the brain
     brain = NovaBrain()
     
+    # Authenticate with Google Calendar once, up front, so every query below
+    # reuses the same calendar service instead of timing the first one
+    brain.skill_instances['calendar'] = CalendarSkill()
+    
     # Test queries
     test_queries = [
         "What's on my schedule today?",
@@ -38,14 +41,14 @@ def test_calendar_responses():
         "What's my busiest day this week?"
     ]
     
-    # Process each query
-    for query in test_queries:
+    # Process the queries concurrently; map() yields results in query order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(brain.process_input, test_queries))
+    
+    for query, response in zip(test_queries, responses):
         print(f"\n🔍 Query: '{query}'")
         print("🤖 Nova's response:")
         
-        # Process the query through the brain
-        response = brain.process_input(query)
-        
         # Print the response
         print(f"   {response}")
         print("-" * 80)
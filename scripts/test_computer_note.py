@@ -4,11 +4,9 @@ test script for creating a computer parts note
 this script directly tests the notesskill's ability to extract content
 from a query about computer parts.
 """
-import sys
-import os
 
-# add the project root to python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # import the notesskill
 from core.skills.notes_skill import NotesSkill
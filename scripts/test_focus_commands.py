@@ -4,12 +4,10 @@ Test script for Focus Mode commands
 
 This script tests various focus mode commands to ensure they're properly recognized.
 """
-import sys
-import os
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -17,14 +15,14 @@ logging.basicConfig(level=logging.INFO,
 
 # Import the necessary classes
 from core.skills.focus_skill import FocusSkill
-from core.services.app_control_service import AppControlService
+from _svc import app_control as shared_app_control
 
 def test_focus_commands():
     """Test various focus mode commands"""
     print("\n===== Testing Focus Mode Commands =====\n")
     
     # Create the necessary services and skill
-    app_control = AppControlService()
+    app_control = shared_app_control()
     focus_skill = FocusSkill(app_control)
     
     # Test commands to process
@@ -5,13 +5,10 @@ Test script for Focus Mode control functionality
 This script tests the FocusController class to verify it can properly
 control macOS Focus modes.
 """
-import sys
-import os
-import time
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -19,6 +16,7 @@ logging.basicConfig(level=logging.INFO,
 
 # Import the FocusController
 from core.services.focus_controller import FocusController
+from _svc import wait_for_focus_change
 
 def test_focus_controller():
     """Test the FocusController functionality"""
@@ -37,8 +35,8 @@ def test_focus_controller():
     success, message = controller.toggle_do_not_disturb()
     print(f"Result: {message}")
     
-    # Wait a moment to let the system update
-    time.sleep(2)
+    # Wait (up to 2s) for the system to report the new mode
+    wait_for_focus_change(controller, current_mode)
     
     # Test 3: Get current focus mode again to verify the change
     print("\nTest 3: Verifying focus mode changed...")
@@ -52,11 +50,12 @@ def test_focus_controller():
     
     # Test 5: Try setting a specific focus mode
     print("\nTest 5: Setting specific focus mode (Do Not Disturb)...")
+    _, mode_before = controller.get_current_focus_mode()
     success, message = controller.set_focus_mode("Do Not Disturb")
     print(f"Result: {message}")
     
-    # Wait a moment
-    time.sleep(2)
+    # Wait (up to 2s) for the mode to change
+    wait_for_focus_change(controller, mode_before)
     
     # Test 6: Disable Do Not Disturb
     print("\nTest 6: Disabling Do Not Disturb...")
@@ -5,19 +5,17 @@ Test script for Focus Skill
 This script tests the FocusSkill class to verify it can properly
 process natural language commands related to focus modes.
 """
-import sys
-import os
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 # Import the necessary classes
-from core.services.app_control_service import AppControlService
+from _svc import app_control as shared_app_control
 from core.skills.focus_skill import FocusSkill
 
 def test_focus_skill():
@@ -25,7 +23,7 @@ def test_focus_skill():
     print("\n===== Testing Focus Skill =====\n")
     
     # Create the necessary services and skill
-    app_control = AppControlService()
+    app_control = shared_app_control()
     focus_skill = FocusSkill(app_control)
     
     # Test commands to process
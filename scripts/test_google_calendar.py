@@ -4,17 +4,36 @@ Test script to debug Google Calendar authentication
 
 This script tests the Google Calendar service to see why it's not connecting.
 """
-import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+from _bootstrap import PROJECT_ROOT
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# GoogleCalendarService instances keyed by the token file's mtime, so repeated
+# runs in one process reuse the authenticated service until the token changes
+_SERVICE_CACHE = {}
+
+def _get_service(service_cls):
+    """Return a cached calendar service, rebuilding it if the token file changed"""
+    token_file = os.path.join(PROJECT_ROOT, 'credentials', 'google_token.pickle')
+    try:
+        token_mtime = os.path.getmtime(token_file)
+    except OSError:
+        token_mtime = None
+    
+    service = _SERVICE_CACHE.get(token_mtime)
+    if service is None:
+        service = service_cls()
+        _SERVICE_CACHE.clear()
+        _SERVICE_CACHE[token_mtime] = service
+    return service
+
 def test_google_calendar_auth():
     """Test Google Calendar authentication"""
     print("===== Testing Google Calendar Authentication =====")
@@ -23,7 +42,7 @@ def test_google_calendar_auth():
         from core.services.google_calendar_service import GoogleCalendarService
         
         print("\n🔍 Initializing Google Calendar service...")
-        service = GoogleCalendarService()
+        service = _get_service(GoogleCalendarService)
         
         print(f"\n🔍 Service available: {service.is_available()}")
         print(f"🔍 Service object: {service.service}")
@@ -31,13 +50,22 @@ def test_google_calendar_auth():
         if service.service:
             print("✅ Google Calendar service is working!")
             
-            # Try to get today's events
+            # Try to get today's and tomorrow's events. Tomorrow's request is
+            # prefetched on a worker thread while today's is in flight.
             print("\n🔍 Testing calendar access...")
             try:
-                events = service.get_today_events()
-                print(f"Found {len(events)} events for today")
-                for event in events:
-                    print(f"  • {event.get('title', 'Untitled')}")
+                with ThreadPoolExecutor(max_workers=1) as prefetch:
+                    tomorrow_future = prefetch.submit(service.get_tomorrow_events)
+                    
+                    events = service.get_today_events()
+                    print(f"Found {len(events)} events for today")
+                    for event in events:
+                        print(f"  • {event.get('title', 'Untitled')}")
+                    
+                    events = tomorrow_future.result()
+                    print(f"Found {len(events)} events for tomorrow")
+                    for event in events:
+                        print(f"  • {event.get('title', 'Untitled')}")
             except Exception as e:
                 print(f"❌ Error getting events: {e}")
                 import traceback
@@ -47,26 +75,29 @@ def test_google_calendar_auth():
             
             # Check credentials
             print("\n🔍 Checking credentials...")
-            credentials_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'credentials')
+            credentials_dir = os.path.join(PROJECT_ROOT, 'credentials')
             print(f"Credentials directory: {credentials_dir}")
             
-            if os.path.exists(credentials_dir):
-                files = os.listdir(credentials_dir)
-                print(f"Files in credentials directory: {files}")
+            try:
+                # One directory scan; existence and sizes come from its entries
+                with os.scandir(credentials_dir) as it:
+                    entries = {entry.name: entry for entry in it}
+            except FileNotFoundError:
+                print("❌ Credentials directory does not exist")
+            else:
+                print(f"Files in credentials directory: {list(entries)}")
                 
                 # Check specific files
-                token_file = os.path.join(credentials_dir, 'google_token.pickle')
-                creds_file = os.path.join(credentials_dir, 'google_credentials.json')
+                token_entry = entries.get('google_token.pickle')
+                creds_entry = entries.get('google_credentials.json')
                 
-                print(f"Token file exists: {os.path.exists(token_file)}")
-                print(f"Credentials file exists: {os.path.exists(creds_file)}")
+                print(f"Token file exists: {token_entry is not None}")
+                print(f"Credentials file exists: {creds_entry is not None}")
                 
-                if os.path.exists(token_file):
-                    print(f"Token file size: {os.path.getsize(token_file)} bytes")
-                if os.path.exists(creds_file):
-                    print(f"Credentials file size: {os.path.getsize(creds_file)} bytes")
-            else:
-                print("❌ Credentials directory does not exist")
+                if token_entry is not None:
+                    print(f"Token file size: {token_entry.stat().st_size} bytes")
+                if creds_entry is not None:
+                    print(f"Credentials file size: {creds_entry.stat().st_size} bytes")
         
     except Exception as e:
         print(f"❌ Error testing Google Calendar: {e}")
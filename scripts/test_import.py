@@ -2,11 +2,17 @@
 """
 Test script to debug import issues
 """
-import sys
-import os
+import time
+import importlib
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+def _timed_import(module_name):
+    """Import a module and return it with the wall-clock import time in ms"""
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    return module, (time.perf_counter() - start) * 1000
 
 def test_imports():
     """Test various imports"""
@@ -14,15 +20,17 @@ def test_imports():
     
     # Test 1: Basic imports
     try:
-        from core.config import config
-        print("✅ core.config imported successfully")
+        module, elapsed_ms = _timed_import("core.config")
+        config = module.config
+        print(f"✅ core.config imported successfully ({elapsed_ms:.1f} ms)")
     except Exception as e:
         print(f"❌ core.config import failed: {e}")
     
     # Test 2: Google Calendar service import
     try:
-        from core.services.google_calendar_service import GoogleCalendarService
-        print("✅ GoogleCalendarService imported successfully")
+        module, elapsed_ms = _timed_import("core.services.google_calendar_service")
+        GoogleCalendarService = module.GoogleCalendarService
+        print(f"✅ GoogleCalendarService imported successfully ({elapsed_ms:.1f} ms)")
         
         # Try to instantiate it
         try:
@@ -38,8 +46,9 @@ def test_imports():
     
     # Test 3: Calendar service import
     try:
-        from core.services.calendar_service import CalendarService
-        print("✅ CalendarService imported successfully")
+        module, elapsed_ms = _timed_import("core.services.calendar_service")
+        CalendarService = module.CalendarService
+        print(f"✅ CalendarService imported successfully ({elapsed_ms:.1f} ms)")
         
         # Try to instantiate it
         try:
@@ -9,26 +9,34 @@ IMPORTANT: Always activate the virtual environment first:
 import sys
 import os
 import time
+import math
 import threading
+import queue
+from collections import deque
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
-try:
-    from core.audio.interruption_monitor import InterruptionMonitor
-    import pyaudio
-    import numpy as np
-    import sounddevice as sd
-except ImportError as e:
+# The audio stack (PortAudio, NumPy, ...) is imported inside each test so the
+# menu, and the tests that don't need a given library, start without it
+
+def _report_import_error(e):
+    """Explain a missing audio dependency"""
     print(f"Error importing required modules: {e}")
     print("Make sure you've activated the virtual environment: source .venv/bin/activate")
-    sys.exit(1)
 
 def play_audio_file(file_path):
     """Play an audio file while monitoring for interruptions"""
     try:
+        import numpy as np
+        import pyaudio
         import soundfile as sf
-        
+        from core.audio.interruption_monitor import InterruptionMonitor
+    except ImportError as e:
+        _report_import_error(e)
+        return
+    
+    try:
         # Load the audio file
         data, sample_rate = sf.read(file_path)
         
@@ -55,37 +63,49 @@ def play_audio_file(file_path):
         # Play the audio file in chunks to allow for interruption
         chunk_size = 1024
         
-        # Create a stream for audio output
+        # Convert the whole file to contiguous float32 once, then hand the
+        # stream byte slices instead of converting every chunk
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        total_frames = len(data)
+        bytes_per_frame = data.strides[0]
+        audio_bytes = memoryview(data).cast('B')
+        position = 0
+        
+        def audio_callback(in_data, frame_count, time_info, status):
+            # Runs on PortAudio's I/O thread: hand over the next slice and
+            # finish once the file is exhausted or we've been interrupted
+            nonlocal position
+            start = position
+            position = min(start + frame_count, total_frames)
+            chunk = audio_bytes[start * bytes_per_frame:position * bytes_per_frame].tobytes()
+            done = position >= total_frames or interrupted.is_set()
+            return chunk, pyaudio.paComplete if done else pyaudio.paContinue
+        
+        # Create a callback-driven stream so playback never waits on this thread
         p = pyaudio.PyAudio()
         stream = p.open(
             format=pyaudio.paFloat32,
             channels=data.shape[1] if len(data.shape) > 1 else 1,
             rate=sample_rate,
-            output=True
+            output=True,
+            frames_per_buffer=chunk_size,
+            stream_callback=audio_callback
         )
         
         print("\n" + "="*60)
         print("🔊 INTERRUPTION TEST ACTIVE - speak anytime to interrupt")
         print("="*60 + "\n")
         
-        # Play audio in chunks
-        for i in range(0, len(data), chunk_size):
-            if interrupted.is_set():
-                break
-                
-            # Get the next chunk
-            chunk = data[i:i+chunk_size]
-            
-            # Convert to float32 if needed
-            if chunk.dtype != np.float32:
-                chunk = chunk.astype(np.float32)
-                
-            # Play the chunk
-            stream.write(chunk.tobytes())
-            
-            # Print progress occasionally
-            if i % (chunk_size * 50) == 0:
-                print(f"▶️ Playing... {i/len(data)*100:.1f}% ({i/sample_rate:.1f}s)")
+        # Wait for playback to finish, printing progress occasionally
+        progress_step = chunk_size * 50
+        next_progress = 0
+        while stream.is_active() and not interrupted.is_set():
+            played = position
+            if played >= next_progress:
+                sys.stdout.write(f"▶️ Playing... {played/total_frames*100:.1f}% ({played/sample_rate:.1f}s)\n")
+                sys.stdout.flush()
+                next_progress = played - played % progress_step + progress_step
+            time.sleep(0.05)
         
         # Clean up
         stream.stop_stream()
@@ -105,6 +125,13 @@ def play_audio_file(file_path):
 
 def test_microphone_monitoring():
     """Test microphone monitoring for energy levels"""
+    try:
+        import numpy as np
+        import sounddevice as sd
+    except ImportError as e:
+        _report_import_error(e)
+        return
+    
     try:
         print("\n" + "="*60)
         print("🎤 MICROPHONE ENERGY LEVEL TEST")
@@ -117,60 +144,87 @@ def test_microphone_monitoring():
         duration = 0.1  # 100ms chunks
         sample_rate = 16000
         
-        # Energy history
-        energy_history = []
+        # Energy history (last 20 blocks) and last 3 blocks, with running sums
+        energy_history = deque(maxlen=20)
+        history_sum = 0.0
+        recent_energy = deque(maxlen=3)
+        recent_sum = 0.0
         baseline_energy = None
         
-        # Start time
-        start_time = time.time()
+        # Energy of each captured block, produced on PortAudio's callback thread
+        energies = queue.Queue()
+        
+        def audio_callback(indata, frames, time_info, status):
+            # Calculate RMS energy from the int16 sum of squares (a single dot
+            # product, no float copy or squared temporary), scaled to [0, 1]
+            samples = indata[:, 0].astype(np.int64)
+            sum_squares = int(np.dot(samples, samples))
+            energies.put_nowait(math.sqrt(sum_squares / samples.size) / 32768.0)
+        
+        # One long-lived input stream instead of a new sd.rec() per block
+        stream = sd.InputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='int16',
+            blocksize=int(duration * sample_rate),
+            latency='low',
+            callback=audio_callback
+        )
+        
+        # Deadline for the next status print
+        next_print = time.monotonic()
         
         try:
-            while True:
-                # Record audio
-                recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='int16')
-                sd.wait()
-                
-                # Calculate energy
-                audio_float = recording.flatten().astype(np.float32) / 32768.0
-                energy = np.sqrt(np.mean(audio_float**2))
-                
-                # Add to history
-                energy_history.append(energy)
-                if len(energy_history) > 20:
-                    energy_history.pop(0)
-                
-                # Establish baseline if not yet set
-                if baseline_energy is None and len(energy_history) >= 10:
-                    baseline_energy = sum(energy_history) / len(energy_history)
-                    print(f"📊 Baseline energy established: {baseline_energy:.6f}")
-                
-                # Calculate current average (last 3 frames)
-                current_avg = sum(energy_history[-3:]) / min(3, len(energy_history))
-                
-                # Detect significant energy increase
-                would_trigger = False
-                if baseline_energy is not None:
-                    would_trigger = (
-                        current_avg > baseline_energy * 3.0 or  # 3x baseline
-                        current_avg > 0.015                      # Absolute threshold
-                    )
-                
-                # Print energy level with visual indicator
-                bar_length = min(50, int(energy * 1000))
-                bar = "█" * bar_length
-                
-                # Only print occasionally to avoid flooding the console
-                elapsed = time.time() - start_time
-                if elapsed % 0.5 < duration:
-                    status = "🔴 WOULD TRIGGER" if would_trigger else "🟢 Normal"
-                    print(f"Energy: {energy:.6f} | Avg: {current_avg:.6f} | {status}")
-                    print(f"[{bar}]")
+            with stream:
+                while True:
+                    # Wait for the next block's energy
+                    energy = energies.get()
                     
-                    if would_trigger:
-                        print(f"🔊 Significant sound detected! {current_avg/baseline_energy:.1f}x baseline")
-                
-                # Short sleep
-                time.sleep(0.01)
+                    # Add to history, dropping the evicted value from the running sums
+                    if len(energy_history) == energy_history.maxlen:
+                        history_sum -= energy_history[0]
+                    energy_history.append(energy)
+                    history_sum += energy
+                    
+                    if len(recent_energy) == recent_energy.maxlen:
+                        recent_sum -= recent_energy[0]
+                    recent_energy.append(energy)
+                    recent_sum += energy
+                    
+                    # Establish baseline if not yet set
+                    if baseline_energy is None and len(energy_history) >= 10:
+                        baseline_energy = history_sum / len(energy_history)
+                        print(f"📊 Baseline energy established: {baseline_energy:.6f}")
+                    
+                    # Calculate current average (last 3 frames)
+                    current_avg = recent_sum / len(recent_energy)
+                    
+                    # Detect significant energy increase
+                    would_trigger = False
+                    if baseline_energy is not None:
+                        would_trigger = (
+                            current_avg > baseline_energy * 3.0 or  # 3x baseline
+                            current_avg > 0.015                      # Absolute threshold
+                        )
+                    
+                    # Only print every half second to avoid flooding the console
+                    now = time.monotonic()
+                    if now >= next_print:
+                        next_print = now + 0.5
+                        
+                        # Print energy level with visual indicator
+                        bar_length = min(50, int(energy * 1000))
+                        bar = "█" * bar_length
+                        
+                        status = "🔴 WOULD TRIGGER" if would_trigger else "🟢 Normal"
+                        message = f"Energy: {energy:.6f} | Avg: {current_avg:.6f} | {status}\n[{bar}]\n"
+                        
+                        if would_trigger:
+                            message += f"🔊 Significant sound detected! {current_avg/baseline_energy:.1f}x baseline\n"
+                        
+                        # One write and flush per update rather than a print per line
+                        sys.stdout.write(message)
+                        sys.stdout.flush()
                 
         except KeyboardInterrupt:
             print("\n✅ Microphone monitoring test completed")
@@ -10,10 +10,12 @@ import sys
 import os
 import time
 import threading
+import queue
 import numpy as np
 import argparse
 import sounddevice as sd
 import wave
+from collections import deque
 
 # Check if running on macOS
 import platform
@@ -30,14 +32,66 @@ try:
     
     # Import PyAudio for comparison testing
     import pyaudio
-    import wave
+    
+    # libsndfile reads WAV and AIFF (and FLAC/OGG) directly
+    import soundfile as sf
     
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("Make sure you've installed PyObjC: pip install pyobjc")
     print("And PyAudio: pip install pyaudio")
+    print("And soundfile: pip install soundfile")
     sys.exit(1)
 
+# Longest stretch of microphone audio kept for --output; older audio is
+# overwritten once the recording buffer wraps around
+MAX_RECORDING_SECONDS = 120
+
+# How quickly the baseline follows quiet frames once established (per
+# frame; ~1 second time constant at 1024-frame buffers)
+BASELINE_ADAPT_RATE = 0.02
+
+# Playback loops the test file this many times with a short pause between
+PLAYBACK_REPEATS = 10
+PLAYBACK_GAP_SECONDS = 0.5
+
+# Messages the audio thread can log, by code. The tap only queues the code
+# and its numbers; the logger thread does the formatting.
+LOG_FORMATS = {
+    'interruption': "🛑 SPEECH INTERRUPTION DETECTED! Energy: {:.6f}",
+    'buffer_error': "❌ Error processing audio buffer: {}",
+    'baseline': "📊 Baseline energy established: {:.6f}\n📊 Energy threshold set to: {:.6f} (very aggressive for testing)",
+    'spike': "⚡ Energy spike: {:.6f} (threshold: {:.6f}, consecutive: {})",
+}
+
+# The logger prints at most this often (10 Hz); energy spikes queued in
+# between are collapsed into the latest one
+LOG_INTERVAL_SECONDS = 0.1
+
+def to_pcm16(samples):
+    """Convert float samples in [-1, 1] to int16 PCM bytes
+    
+    Scaling, rounding and clipping all happen in one float32 scratch array,
+    so samples just over full scale saturate instead of wrapping negative.
+    """
+    scratch = np.multiply(samples, 32767.0, dtype=np.float32)
+    np.rint(scratch, out=scratch)
+    np.clip(scratch, -32768, 32767, out=scratch)
+    return scratch.astype(np.int16).tobytes()
+
+def write_mono_wav(path, samples, sample_rate):
+    """Write float mono samples to a 16-bit WAV file in a single write
+    
+    The frame count is set before the data goes out, so the header is
+    written once with the right sizes and never patched afterwards.
+    """
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)  # 2 bytes for int16
+        wf.setframerate(sample_rate)
+        wf.setnframes(len(samples))
+        wf.writeframesraw(to_pcm16(samples))
+
 class MacOSVoiceProcessingDemo:
     """Demo of macOS Voice Processing I/O for echo cancellation"""
     
@@ -50,31 +104,50 @@ class MacOSVoiceProcessingDemo:
         self.is_running = False
         self.audio_session = None
         
-        # For storing audio data
-        self.recorded_data = []
+        # Session and input format properties, read once at setup rather
+        # than through PyObjC on every use
+        self.session_sample_rate = None
+        self.io_buffer_duration = None
+        self.input_channels = 1
+        
+        # For storing audio data (ring buffer allocated once the input format is known)
+        self.recording_buffer = None
+        self.recorded_frames = 0
         self.should_record = False
         
         # For playback
         self.playback_file = None
-        self.playback_data = None
+        self.playback_samples = None  # float32, shape (frames, channels)
         self.playback_position = 0
         self.playback_sample_rate = 44100
+        self.playback_channels = 1
         
         # For interruption detection
         self.energy_threshold = 0.02  # Very aggressive for testing
         self.was_interrupted = False
         self.interruption_event = threading.Event()
+        self.playback_done = threading.Event()
         self.should_transcribe = False
         
-        # For audio capture during interruption
+        # For audio capture during interruption (filled by the input tap)
         self.interruption_audio_file = None
         self.audio_capture_duration = 3.0  # seconds
+        self.input_sample_rate = None
+        self.capture_buffer = None
+        self.captured_frames = 0
+        self.is_capturing = False
+        self.capture_complete = threading.Event()
         
         # For energy tracking
-        self.energy_history = []
+        self.energy_history = deque(maxlen=20)  # Keep last 20 frames
         self.consecutive_frames_above_threshold = 0
         self.baseline_energy = None
         
+        # Messages from the audio thread, printed by a background logger so
+        # the tap never blocks on stdout
+        self.log_queue = queue.Queue()
+        threading.Thread(target=self._print_log_messages, daemon=True).start()
+        
     def setup_audio_session(self):
         """Set up the AVAudioSession for voice processing"""
         try:
@@ -95,25 +168,6 @@ class MacOSVoiceProcessingDemo:
                 None
             )
             
-            # Enable echo cancellation
-            # The method name might vary between PyObjC versions
-            try:
-                # Try the newer method name first
-                echo_result = self.audio_session.setPreferredInputWithAEC_(True)
-                print("Using setPreferredInputWithAEC_ method")
-            except AttributeError:
-                try:
-                    # Try alternative method name
-                    echo_result = self.audio_session.setPrefersEchoCancellation_(True)
-                    print("Using setPrefersEchoCancellation_ method")
-                except AttributeError:
-                    # Fallback to another possible method name
-                    try:
-                        echo_result = self.audio_session.setAECEnabled_(True)
-                        print("Using setAECEnabled_ method")
-                    except AttributeError:
-                        print("⚠️ Could not find echo cancellation method - AEC may not be available")
-            
             # Activate the session
             activate_result = self.audio_session.setActive_withOptions_error_(
                 True,
@@ -121,12 +175,13 @@ class MacOSVoiceProcessingDemo:
                 None
             )
             
+            self.session_sample_rate = int(self.audio_session.sampleRate())
+            self.io_buffer_duration = float(self.audio_session.IOBufferDuration())
+            
             print("✅ Audio session configured for voice processing")
-            print(f"   Sample rate: {self.audio_session.sampleRate()} Hz")
-            print(f"   I/O buffer duration: {self.audio_session.IOBufferDuration()} sec")
+            print(f"   Sample rate: {self.session_sample_rate} Hz")
+            print(f"   I/O buffer duration: {self.io_buffer_duration} sec")
             print(f"   Mode: {self.audio_session.mode()}")
-            # Echo cancellation status is not directly accessible in all PyObjC versions
-            print(f"   Echo cancellation: Enabled via VoiceChat mode")
             
             return True
             
@@ -147,6 +202,15 @@ class MacOSVoiceProcessingDemo:
             # Create a mixer node
             self.mixer_node = self.audio_engine.mainMixerNode()
             
+            # Put the input node on the VoiceProcessingIO unit for real echo
+            # cancellation (macOS 10.15+). This changes the node's formats, so
+            # it has to happen before they are read below.
+            enabled, error = self.input_node.setVoiceProcessingEnabled_error_(True, None)
+            if enabled:
+                print("✅ Voice processing (echo cancellation) enabled on input node")
+            else:
+                print(f"⚠️ Could not enable voice processing - AEC may not be available: {error}")
+            
             # Get the input and output formats
             input_format = self.input_node.inputFormatForBus_(0)
             output_format = self.output_node.outputFormatForBus_(0)
@@ -155,6 +219,14 @@ class MacOSVoiceProcessingDemo:
             print(f"   Input format: {input_format.sampleRate()} Hz, {input_format.channelCount()} channels")
             print(f"   Output format: {output_format.sampleRate()} Hz, {output_format.channelCount()} channels")
             
+            # Preallocate the recording and interruption capture buffers so
+            # the tap never grows a list
+            self.input_sample_rate = int(input_format.sampleRate())
+            self.input_channels = int(input_format.channelCount())
+            self.recording_buffer = np.empty(self.input_sample_rate * MAX_RECORDING_SECONDS, dtype=np.float32)
+            self.recorded_frames = 0
+            self.capture_buffer = np.empty(int(self.input_sample_rate * self.audio_capture_duration), dtype=np.float32)
+            
             # Install a tap on the input node to get the audio data
             buffer_size = 1024  # Adjust as needed
             self.input_node.installTapOnBus_bufferSize_format_block_(
@@ -181,78 +253,173 @@ class MacOSVoiceProcessingDemo:
                 
             # Get the audio data as numpy array
             frames = buffer.frameLength()
-            channels = buffer.format().channelCount()
+            if frames == 0:
+                return
             
-            # Get the buffer for each channel
-            for channel in range(channels):
-                try:
-                    # Get the audio data for this channel
-                    audio_buffer = buffer.floatChannelData()[channel]
-                    
-                    # Convert to Python list first to avoid PyObjC issues
-                    audio_list = []
-                    for i in range(frames):
-                        audio_list.append(audio_buffer[i])
+            # View each channel through its varlist buffer rather than reading
+            # it sample by sample. The views are only valid during this
+            # callback; recording and capture copy out of them.
+            channel_data = buffer.floatChannelData()
+            if self.input_channels == 1:
+                audio_data = np.frombuffer(channel_data[0].as_buffer(frames), dtype=np.float32)
+            else:
+                # Channels carry the same voice, so record and detect on the
+                # mixdown instead of repeating everything per channel
+                audio_data = np.stack([
+                    np.frombuffer(channel_data[channel].as_buffer(frames), dtype=np.float32)
+                    for channel in range(self.input_channels)
+                ], axis=1).mean(axis=1, dtype=np.float32)
+            
+            # Store the data
+            self._record(audio_data)
+            
+            # Keep filling the interruption capture
+            if self.is_capturing:
+                self._capture(audio_data)
+            
+            # Check for interruption
+            if self.is_running and not self.was_interrupted:
+                # Calculate RMS energy (sum of squares as a single dot product)
+                energy = float(np.sqrt(np.dot(audio_data, audio_data) / frames))
+                
+                if self._detect_speech(energy):
+                    self._log('interruption', energy)
                     
-                    # Convert to numpy array
-                    import numpy as np
-                    audio_data = np.array(audio_list, dtype=np.float32)
+                    # Start capturing what the user says from the next buffer on
+                    self.captured_frames = 0
+                    self.capture_complete.clear()
+                    self.is_capturing = True
                     
-                    # Store the data
-                    if len(audio_data) > 0:
-                        self.recorded_data.append(audio_data)
+                    self.was_interrupted = True
+                    self.interruption_event.set()
                     
-                    # Check for interruption
-                    if self.is_running and not self.was_interrupted and len(audio_data) > 0:
-                        # Calculate energy
-                        energy = 0
-                        for sample in audio_data:
-                            energy += sample * sample
-                        energy = (energy / len(audio_data)) ** 0.5
-                        
-                        # Store energy for tracking
-                        if not hasattr(self, 'energy_history'):
-                            self.energy_history = []
-                            self.consecutive_frames_above_threshold = 0
-                            self.baseline_energy = None
-                            
-                        # Add to history
-                        self.energy_history.append(energy)
-                        if len(self.energy_history) > 20:  # Keep last 20 frames
-                            self.energy_history.pop(0)
-                            
-                        # Establish baseline if not yet set
-                        if self.baseline_energy is None and len(self.energy_history) >= 10:
-                            self.baseline_energy = sum(self.energy_history) / len(self.energy_history)
-                            print(f"📊 Baseline energy established: {self.baseline_energy:.6f}")
-                            # Set threshold very aggressive for this test
-                            self.energy_threshold = max(0.02, self.baseline_energy * 2.0)
-                            print(f"📊 Energy threshold set to: {self.energy_threshold:.6f} (very aggressive for testing)")
-                        
-                        # Track consecutive frames above threshold
-                        if energy > self.energy_threshold:
-                            self.consecutive_frames_above_threshold += 1
-                            print(f"⚡ Energy spike: {energy:.6f} (threshold: {self.energy_threshold:.6f}, consecutive: {self.consecutive_frames_above_threshold})")
-                        else:
-                            # Reset counter if energy drops below threshold
-                            if self.consecutive_frames_above_threshold > 0:
-                                self.consecutive_frames_above_threshold = 0
-                        
-                        # Only trigger interruption if energy stays above threshold for multiple frames
-                        # This helps filter out short noise spikes
-                        if self.consecutive_frames_above_threshold >= 2:  # Reduced to 2 frames for testing
-                            print(f"🛑 SPEECH INTERRUPTION DETECTED! Energy: {energy:.6f}")
-                            self.was_interrupted = True
-                            self.interruption_event.set()
-                            
-                            # We'll set a flag to let the direct monitoring know to capture audio
-                            # This will be handled by the direct monitoring thread
-                            self.should_transcribe = True
-                except Exception as e:
-                    print(f"❌ Error processing channel {channel}: {e}")
+                    # We'll set a flag to let the interruption monitoring know to capture audio
+                    # This will be handled by the interruption monitoring thread
+                    self.should_transcribe = True
         
         except Exception as e:
-            print(f"❌ Error processing audio buffer: {e}")
+            self._log('buffer_error', e)
+    
+    def _detect_speech(self, energy):
+        """Advance the energy VAD by one frame; True once speech should interrupt
+        
+        Thresholds are read into locals and the state written back once, so the
+        per-frame work stays a handful of float comparisons.
+        """
+        history = self.energy_history
+        baseline = self.baseline_energy
+        threshold = self.energy_threshold
+        
+        # Add to history (the deque drops the oldest frame itself)
+        history.append(energy)
+        
+        # Establish baseline if not yet set
+        if baseline is None:
+            if len(history) >= 10:
+                baseline = sum(history) / len(history)
+                # Set threshold very aggressive for this test
+                threshold = max(0.02, baseline * 2.0)
+                self._log('baseline', baseline, threshold)
+        elif energy <= threshold:
+            # Let the baseline follow the room in both directions, but
+            # only from quiet frames so speech doesn't inflate it
+            baseline += BASELINE_ADAPT_RATE * (energy - baseline)
+            threshold = max(0.02, baseline * 2.0)
+        
+        self.baseline_energy = baseline
+        self.energy_threshold = threshold
+        
+        # Track consecutive frames above threshold
+        if energy > threshold:
+            self.consecutive_frames_above_threshold += 1
+            self._log('spike', energy, threshold, self.consecutive_frames_above_threshold)
+        else:
+            # Reset counter if energy drops below threshold
+            self.consecutive_frames_above_threshold = 0
+        
+        # Only trigger interruption if energy stays above threshold for multiple frames
+        # This helps filter out short noise spikes
+        return self.consecutive_frames_above_threshold >= 2  # Reduced to 2 frames for testing
+    
+    def _log(self, code, *values):
+        """Queue a LOG_FORMATS code and its values from the audio thread"""
+        self.log_queue.put_nowait((code, values))
+    
+    def _print_log_messages(self):
+        """Format and print queued audio-thread messages (runs on the logger thread)
+        
+        Wakes at most every LOG_INTERVAL_SECONDS and drains the queue. A run
+        of energy spikes prints only its latest entry plus how many it
+        replaced; every other message is printed in order.
+        """
+        while True:
+            entries = [self.log_queue.get()]
+            while True:
+                try:
+                    entries.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = []
+            spike, skipped = None, 0
+            for code, values in entries:
+                if code == 'spike':
+                    if spike is not None:
+                        skipped += 1
+                    spike = values
+                    continue
+                if spike is not None:
+                    lines.append(self._format_spike(spike, skipped))
+                    spike, skipped = None, 0
+                lines.append(LOG_FORMATS[code].format(*values))
+            if spike is not None:
+                lines.append(self._format_spike(spike, skipped))
+            print("\n".join(lines))
+            
+            time.sleep(LOG_INTERVAL_SECONDS)
+    
+    @staticmethod
+    def _format_spike(values, skipped):
+        """Format the latest energy spike, noting how many earlier ones it replaced"""
+        line = LOG_FORMATS['spike'].format(*values)
+        return f"{line} (+{skipped} more)" if skipped else line
+    
+    def _record(self, audio_data):
+        """Copy a block of samples into the recording ring buffer"""
+        size = len(self.recording_buffer)
+        start = self.recorded_frames % size
+        end = start + len(audio_data)
+        
+        if end <= size:
+            self.recording_buffer[start:end] = audio_data
+        else:
+            # Wrap around to the beginning of the buffer
+            split = size - start
+            self.recording_buffer[start:] = audio_data[:split]
+            self.recording_buffer[:end - size] = audio_data[split:]
+        
+        self.recorded_frames += len(audio_data)
+    
+    def _capture(self, audio_data):
+        """Copy a block of samples into the interruption capture buffer"""
+        remaining = len(self.capture_buffer) - self.captured_frames
+        count = min(remaining, len(audio_data))
+        self.capture_buffer[self.captured_frames:self.captured_frames + count] = audio_data[:count]
+        self.captured_frames += count
+        
+        if self.captured_frames >= len(self.capture_buffer):
+            self.is_capturing = False
+            self.capture_complete.set()
+    
+    def _recorded_audio(self):
+        """Return the recorded samples in order, oldest first"""
+        size = len(self.recording_buffer)
+        if self.recorded_frames <= size:
+            # Not wrapped yet, so the recording is a prefix of the buffer
+            return self.recording_buffer[:self.recorded_frames]
+        
+        start = self.recorded_frames % size
+        return np.concatenate((self.recording_buffer[start:], self.recording_buffer[:start]))
     
     def start(self):
         """Start the audio engine"""
@@ -293,64 +460,38 @@ class MacOSVoiceProcessingDemo:
             return False
     
     def load_audio_file(self, file_path):
-        """Load an audio file for playback using a simpler approach with PyAudio"""
+        """Load an audio file for playback, decoding it in-process with soundfile"""
         try:
-            # Use PyAudio and wave for simplicity
-            import wave
-            
-            # Check if it's an AIFF file and convert if needed
-            if file_path.lower().endswith('.aiff') or file_path.lower().endswith('.aif'):
-                print(f"Converting AIFF file to WAV format for compatibility...")
-                
-                # Create a temporary WAV file
-                import tempfile
-                import subprocess
-                
-                temp_wav = tempfile.mktemp(suffix='.wav')
-                
-                # Use ffmpeg or afconvert if available
-                try:
-                    subprocess.run(['afconvert', '-f', 'WAVE', '-d', 'LEI16@44100', file_path, temp_wav], 
-                                  check=True, capture_output=True)
-                    file_path = temp_wav
-                    self.temp_wav_path = temp_wav  # Store the path for later use
-                    print(f"Converted to temporary WAV: {temp_wav}")
-                except (subprocess.SubprocessError, FileNotFoundError):
-                    print("⚠️ Could not convert AIFF to WAV - trying direct load")
-            
-            # Open the wave file
-            try:
-                wf = wave.open(file_path, 'rb')
-                
+            # soundfile handles AIFF as well as WAV, so no conversion step is needed
+            with sf.SoundFile(file_path) as audio_file:
                 # Get file properties
-                self.playback_sample_rate = wf.getframerate()
-                channels = wf.getnchannels()
-                sample_width = wf.getsampwidth()
-                frame_count = wf.getnframes()
-                
-                # Read all frames
-                self.playback_data = wf.readframes(frame_count)
-                wf.close()
-                
-                print(f"✅ Loaded audio file: {file_path}")
-                print(f"   Duration: {frame_count / self.playback_sample_rate:.2f} seconds")
-                print(f"   Sample rate: {self.playback_sample_rate} Hz")
-                print(f"   Channels: {channels}")
-                print(f"   Sample width: {sample_width} bytes")
+                self.playback_sample_rate = audio_file.samplerate
+                channels = audio_file.channels
+                sample_format = audio_file.subtype
                 
-                return True
-                
-            except Exception as e:
-                print(f"❌ Failed to load audio file with wave: {e}")
-                return False
+                # Decode once to the float32 frames the output stream plays, so
+                # the playback callback only ever copies slices
+                self.playback_samples = audio_file.read(dtype='float32', always_2d=True)
+            
+            self.playback_channels = channels
+            self.playback_file = file_path
+            frame_count = len(self.playback_samples)
+            
+            print(f"✅ Loaded audio file: {file_path}")
+            print(f"   Duration: {frame_count / self.playback_sample_rate:.2f} seconds")
+            print(f"   Sample rate: {self.playback_sample_rate} Hz")
+            print(f"   Channels: {channels}")
+            print(f"   Sample format: {sample_format}")
+            
+            return True
                 
         except Exception as e:
             print(f"❌ Failed to load audio file: {e}")
             return False
     
     def play_audio_with_interruption(self):
-        """Play the loaded audio file with interruption detection using subprocess"""
-        if not self.playback_data:
+        """Play the loaded audio file with interruption detection"""
+        if self.playback_samples is None:
             print("❌ No audio file loaded")
             return False
         
@@ -358,6 +499,7 @@ class MacOSVoiceProcessingDemo:
             # Reset interruption state
             self.was_interrupted = False
             self.interruption_event.clear()
+            self.playback_done.clear()
             
             # Enable recording to detect interruptions
             self.should_record = True
@@ -366,136 +508,75 @@ class MacOSVoiceProcessingDemo:
             print("🔊 PLAYING AUDIO - speak anytime to interrupt")
             print("="*60)
             
-            # Use macOS 'afplay' command to play the audio
-            import subprocess
-            import threading
-            
-            # Get the path of the temporary file
-            temp_wav_path = None
-            if hasattr(self, 'temp_wav_path') and self.temp_wav_path:
-                temp_wav_path = self.temp_wav_path
-            else:
-                # Find the most recently created temporary WAV file
-                import glob
-                import os
-                temp_files = glob.glob('/var/folders/*/T/tmp*.wav')
-                if temp_files:
-                    temp_files.sort(key=os.path.getmtime, reverse=True)
-                    temp_wav_path = temp_files[0]
-            
-            if not temp_wav_path:
-                print("❌ Could not find temporary WAV file")
-                return False
+            print(f"Playing audio file: {self.playback_file}")
+            
+            # Each repeat is one play of the file followed by the pause
+            samples = self.playback_samples
+            cycle_frames = len(samples) + int(self.playback_sample_rate * PLAYBACK_GAP_SECONDS)
+            total_frames = cycle_frames * PLAYBACK_REPEATS
+            position = 0
+            
+            def playback_callback(outdata, frames, time_info, status):
+                # Fill the device buffer straight from the preloaded samples,
+                # wrapping back to the start of the file for each repeat
+                nonlocal position
+                written = 0
+                while written < frames and position < total_frames:
+                    offset = position % cycle_frames
+                    count = min(frames - written, cycle_frames - offset, total_frames - position)
+                    if offset < len(samples):
+                        count = min(count, len(samples) - offset)
+                        outdata[written:written + count] = samples[offset:offset + count]
+                    else:
+                        # Silence between repeats
+                        outdata[written:written + count] = 0
+                    written += count
+                    position += count
                 
-            print(f"Playing audio file: {temp_wav_path}")
-            
-            # Create a loop script to play the file multiple times at normal speed
-            loop_script = f"""
-            for i in {{1..10}}; do
-                afplay "{temp_wav_path}"
-                sleep 0.5
-            done
-            """
-            
-            # Start the loop script in a shell
-            process = subprocess.Popen(['bash', '-c', loop_script])
-            print("\n🔴 NOW PLAYING AUDIO 10 TIMES - SPEAK LOUDLY TO TEST INTERRUPTION 🔴")
+                if written < frames:
+                    outdata[written:] = 0
+                    raise sd.CallbackStop
+            
+            # Play from this process so an interruption can stop it immediately
+            stream = sd.OutputStream(
+                samplerate=self.playback_sample_rate,
+                channels=self.playback_channels,
+                dtype='float32',
+                callback=playback_callback,
+                finished_callback=self.playback_done.set
+            )
+            stream.start()
+            print(f"\n🔴 NOW PLAYING AUDIO {PLAYBACK_REPEATS} TIMES - SPEAK LOUDLY TO TEST INTERRUPTION 🔴")
             
             # Monitor for interruptions
             def check_for_interruption():
-                # For direct monitoring during playback
-                import numpy as np
-                import sounddevice as sd
-                
-                # Track energy for interruption detection
-                energy_history = []
-                consecutive_frames = 0
-                baseline = None
-                
-                print("👂 Direct monitoring for interruptions...")
+                # The input tap does the speech detection on the echo-cancelled
+                # signal; this thread only stops playback once it fires
+                print("👂 Monitoring for interruptions...")
                 
-                while process.poll() is None:
-                    # First check if interruption was already detected by audio buffer processing
-                    if self.interruption_event.is_set():
-                        print("🛑 Stopping playback due to interruption (from buffer processing)")
-                        process.terminate()
+                # Block on the interruption event so we react as soon as the
+                # tap sets it; the timeout only bounds how long we take to
+                # notice that playback finished on its own
+                while not self.playback_done.is_set():
+                    if self.interruption_event.wait(timeout=0.05):
+                        print("🛑 Stopping playback due to interruption")
+                        stream.abort()
                         
                         # Capture audio for later analysis
                         self.capture_interruption_audio()
                         
                         break
-                    
-                    # Also do our own monitoring with sounddevice
-                    try:
-                        # Record a short audio sample
-                        duration = 0.1  # 100ms
-                        samples = int(self.playback_sample_rate * duration)
-                        recording = sd.rec(samples, samplerate=self.playback_sample_rate, channels=1, dtype='int16')
-                        sd.wait()
-                        
-                        # Calculate energy
-                        audio_float = recording.flatten().astype(np.float32) / 32768.0
-                        energy = np.sqrt(np.mean(audio_float**2))
-                        
-                        # Print energy level to see if microphone is picking up sound
-                        scale = 1000
-                        energy_bar = "█" * int(energy * scale)  # Scale for visualization
-                        
-                        # Show threshold if baseline is established
-                        if baseline is not None:
-                            threshold_pos = int(threshold * scale)
-                            threshold_marker = " " * threshold_pos + "▲"
-                            print(f"🎤 Energy: {energy:.6f} |{energy_bar}|\n   Threshold: {threshold:.6f} {threshold_marker}")
-                        else:
-                            print(f"🎤 Energy: {energy:.6f} |{energy_bar}| (establishing baseline...)")
-                        
-                        # Add to history
-                        energy_history.append(energy)
-                        if len(energy_history) > 20:
-                            energy_history.pop(0)
-                        
-                        # Establish baseline if not yet set
-                        if baseline is None and len(energy_history) >= 10:
-                            baseline = sum(energy_history) / len(energy_history)
-                            print(f"📊 Direct monitoring baseline: {baseline:.6f}")
-                            # Set threshold very aggressive for this test
-                            threshold = max(0.02, baseline * 2.0)
-                            print(f"📊 Direct monitoring threshold: {threshold:.6f} (very aggressive for testing)")
-                        
-                        # Check for interruption
-                        if baseline is not None:
-                            if energy > threshold:
-                                consecutive_frames += 1
-                                print(f"⚡ Direct energy spike: {energy:.6f} (threshold: {threshold:.6f}, consecutive: {consecutive_frames})")
-                            else:
-                                consecutive_frames = 0
-                            
-                            # Only trigger after multiple consecutive frames
-                            if consecutive_frames >= 2:  # Reduced to 2 frames for testing
-                                print(f"🛑 DIRECT SPEECH INTERRUPTION! Energy: {energy:.6f}")
-                                self.was_interrupted = True
-                                self.interruption_event.set()
-                                
-                                # Stop playback first
-                                process.terminate()
-                                
-                                # Then capture audio for later analysis
-                                self.capture_interruption_audio()
-                                    
-                                # No transcription code needed
-                                
-                                break
-                    except Exception as e:
-                        print(f"Error in direct monitoring: {e}")
-                    
-                    time.sleep(0.05)
             
             # Start the interruption monitoring thread
             monitor_thread = threading.Thread(target=check_for_interruption, daemon=True)
             monitor_thread.start()
             
             # Wait for playback to complete or be interrupted
-            process.wait()
+            self.playback_done.wait()
+            
+            # The tap must keep running until any interruption capture is saved
+            monitor_thread.join()
+            stream.close()
             
             # Stop recording
             self.should_record = False
@@ -513,65 +594,32 @@ class MacOSVoiceProcessingDemo:
             return False
     
     def capture_interruption_audio(self):
-        """Capture audio for a few seconds after interruption is detected"""
+        """Save the audio the input tap captures for a few seconds after interruption"""
         try:
             print(f"🎤 Capturing {self.audio_capture_duration} seconds of audio after interruption...")
             
             # Create a fixed filename in the current directory
             self.interruption_audio_file = "audio_cache/interruption_latest.wav"
             
-            # Record audio using a subprocess to avoid segmentation faults
-            try:
-                # Import needed modules
-                import subprocess
-                
-                # Create a simple Python script to record audio
-                record_script = """
-import sounddevice as sd
-import wave
-import numpy as np
-import sys
-
-duration = 3.0  # seconds
-fs = 44100  # sample rate
-channels = 1
-        filename = "audio_cache/interruption_latest.wav"
-
-print(f"Recording {duration} seconds of audio...")
-recording = sd.rec(int(duration * fs), samplerate=fs, channels=channels, dtype='int16')
-sd.wait()
-
-print(f"Saving to {filename}...")
-with wave.open(filename, 'wb') as wf:
-    wf.setnchannels(channels)
-    wf.setsampwidth(2)  # 2 bytes for int16
-    wf.setframerate(fs)
-    wf.writeframes(recording.tobytes())
-
-print(f"Done! Audio saved to {filename}")
-"""
-                # Write the script to a temporary file
-                with open("temp_record.py", "w") as f:
-                    f.write(record_script)
-                
-                # Run the script in a separate process
-                print("Starting recording subprocess...")
-                subprocess.run([sys.executable, "temp_record.py"], check=True)
-                
-                # Clean up
-                os.remove("temp_record.py")
-                
-                print(f"\n🎙️ INTERRUPTION AUDIO CAPTURED!")
-                print(f"✅ Interruption audio saved to: {self.interruption_audio_file}")
-                print(f"🔊 To analyze this audio later, you can use:")
-                print(f"   - Play: ffplay {self.interruption_audio_file}")
-                print(f"   - Transcribe: whisper {self.interruption_audio_file}")
-                print(f"   - Process with Nova: python -m core.main --transcribe {self.interruption_audio_file}\n")
-                
-                return self.interruption_audio_file
-            except Exception as e:
-                print(f"❌ Error in recording subprocess: {e}")
-                return None
+            # The tap fills the capture buffer; just wait for it rather than
+            # opening a second recording stream
+            if not self.capture_complete.wait(timeout=self.audio_capture_duration + 1.0):
+                print("⚠️ Capture ended early - saving what was recorded")
+            self.is_capturing = False
+            
+            captured = self.capture_buffer[:self.captured_frames]
+            
+            os.makedirs(os.path.dirname(self.interruption_audio_file), exist_ok=True)
+            write_mono_wav(self.interruption_audio_file, captured, self.input_sample_rate)
+            
+            print(f"\n🎙️ INTERRUPTION AUDIO CAPTURED!")
+            print(f"✅ Interruption audio saved to: {self.interruption_audio_file}")
+            print(f"🔊 To analyze this audio later, you can use:")
+            print(f"   - Play: ffplay {self.interruption_audio_file}")
+            print(f"   - Transcribe: whisper {self.interruption_audio_file}")
+            print(f"   - Process with Nova: python -m core.main --transcribe {self.interruption_audio_file}\n")
+            
+            return self.interruption_audio_file
                 
         except Exception as e:
             print(f"❌ Error capturing interruption audio: {e}")
@@ -587,31 +635,19 @@ print(f"Done! Audio saved to {filename}")
         print("Speak occasionally during playback to test barge-in detection.")
         
         # Clear any previous recordings
-        self.recorded_data = []
+        self.recorded_frames = 0
         
         # Play audio with interruption detection
         result = self.play_audio_with_interruption()
         
-        if output_file and self.recorded_data:
+        if output_file and self.recording_buffer is not None:
             try:
-                import numpy as np
-                
-                # Filter out empty arrays
-                valid_data = [arr for arr in self.recorded_data if len(arr) > 0]
-                
-                if valid_data:
-                    # Convert recorded data to a single numpy array
-                    all_data = np.concatenate(valid_data)
-                    
-                    # Scale to int16 range
-                    all_data = (all_data * 32767).astype(np.int16)
+                if self.recorded_frames:
+                    # Recorded data straight from the ring buffer
+                    all_data = self._recorded_audio()
                     
                     # Save to WAV file
-                    with wave.open(output_file, 'wb') as wf:
-                        wf.setnchannels(1)
-                        wf.setsampwidth(2)  # 2 bytes for int16
-                        wf.setframerate(int(self.audio_session.sampleRate()))
-                        wf.writeframes(all_data.tobytes())
+                    write_mono_wav(output_file, all_data, self.input_sample_rate)
                     
                     print(f"✅ Recorded audio saved to: {output_file}")
                 else:
@@ -11,10 +11,10 @@ Usage:
 """
 import sys
 import os
-import time
 
 # Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
 # Import the app control service
 from core.services.app_control_service import AppControlService
@@ -31,35 +31,27 @@ def test_app_control_service():
     success, message = app_control.create_note("Test Note", "This is a test note created by Nova.")
     print(f"Create note result: {success}, {message}")
     
-    # Wait a moment for the note to be created
-    time.sleep(1)
-    
     # Test adding to the note
     print("\nTesting add_to_note...")
     success, message = app_control.add_to_note("Test Note", "Adding more content to the test note.")
     print(f"Add to note result: {success}, {message}")
     
-    # Test listing notes
-    print("\nTesting list_notes...")
-    success, notes = app_control.list_notes()
-    if success:
-        print(f"Found {len(notes)} notes:")
-        for note in notes[:10]:  # Show up to 10 notes
-            print(f"  - {note}")
-        if len(notes) > 10:
-            print(f"  ... and {len(notes) - 10} more")
-    else:
-        print("Failed to list notes")
-    
-    # Test finding notes
-    print("\nTesting find_note...")
-    success, notes = app_control.find_note("Test")
+    # Test listing and finding notes, both read in one osascript call
+    print("\nTesting batch_note_queries (list_notes + find_note)...")
+    success, results = app_control.batch_note_queries([
+        ("list", {"limit": 10}),  # Show up to 10 notes
+        ("find", {"search_term": "Test"})
+    ])
     if success:
-        print(f"Found {len(notes)} notes matching 'Test':")
+        notes, matching = results
+        print(f"First {len(notes)} notes:")
         for note in notes:
             print(f"  - {note}")
+        print(f"Found {len(matching)} notes matching 'Test':")
+        for note in matching:
+            print(f"  - {note}")
     else:
-        print("Failed to find notes")
+        print("Failed to list and find notes")
 
 def test_notes_skill():
     """Test the NotesSkill with various queries"""
@@ -82,9 +74,6 @@ def test_notes_skill():
         print(f"\nTesting query: '{query}'")
         response = notes_skill.handle_query(query)
         print(f"Response: {response}")
-        
-        # Wait a moment between queries
-        time.sleep(1)
 
 def main():
     """Main test function"""
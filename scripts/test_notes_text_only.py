@@ -4,12 +4,9 @@ test script for notes app integration with text-only input
 this script bypasses the audio components and directly tests the nova brain's
 ability to process notes-related commands through text input.
 """
-import sys
-import os
-import time
 
-# add the project root to python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # import the brain directly
 from core.brain import NovaBrain
@@ -34,18 +31,13 @@ def test_notes_with_text():
         "Find notes about grocery"
     ]
     
-    # process each command
-    for command in test_commands:
+    # process all commands in one batch (no pauses; the brain is text-only here)
+    responses = brain.process_batch(test_commands)
+    
+    # display each exchange
+    for command, response in zip(test_commands, responses):
         print(f"\n> user: {command}")
-        
-        # process the command
-        response = brain.process_input(command)
-        
-        # display the response
         print(f"< nova: {response}")
-        
-        # pause between commands
-        time.sleep(1)
     
     print("\n=== test complete ===\n")
 
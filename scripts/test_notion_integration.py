@@ -2,27 +2,35 @@
 """
 Test script for Nova's Notion integration
 """
-import os
-import sys
 import json
+import asyncio
+import functools
 from datetime import datetime, timedelta
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+# Shared NotionClient, so the client and query tests use the same instance
+from _svc import notion_client
 
 # Import Nova components
-from core.integrations.notion_client import NotionClient
 from core.services.calendar_service import CalendarService
 from core.skills.calendar_skill import CalendarSkill
 from config import config
 
+@functools.lru_cache(maxsize=1)
+def _week_dates():
+    """Today and the following 6 days, computed once for the whole run"""
+    today = datetime.now().date()
+    return tuple(today + timedelta(days=i) for i in range(7))
+
 def test_notion_client():
     """Test the Notion client configuration"""
     print("\n" + "="*60)
     print("🔍 Testing Notion Client Configuration")
     print("="*60)
     
-    client = NotionClient()
+    client = notion_client()
     
     print(f"API Key configured: {'✅ Yes' if client.api_key else '❌ No'}")
     print(f"Database ID configured: {'✅ Yes' if client.database_id else '❌ No'}")
@@ -43,7 +51,7 @@ def test_notion_database_query():
     print("🔍 Testing Notion Database Query")
     print("="*60)
     
-    client = NotionClient()
+    client = notion_client()
     
     if not client.is_available():
         print("⚠️  Notion client not available, skipping database query test.")
@@ -52,7 +60,7 @@ def test_notion_database_query():
     print("Querying database for events...")
     
     # Try to query events for the next 7 days
-    today = datetime.now().date()
+    today = _week_dates()[0]
     next_week = today + timedelta(days=7)
     
     events = client.get_calendar_events(today, next_week)
@@ -76,23 +84,27 @@ def test_calendar_service():
     
     service = CalendarService()
     
-    print("Getting today's schedule...")
-    today = service.get_today_schedule()
+    # The three schedules are independent, so fetch them concurrently
+    print("Getting today's, tomorrow's and week schedules...")
+    today, tomorrow, week = asyncio.run(_gather_schedules(service))
     
     print(f"Found {len(today.events)} events for today.")
     print("\nFormatted schedule:")
     print(service.format_day_schedule(today))
     
-    print("\nGetting tomorrow's schedule...")
-    tomorrow = service.get_tomorrow_schedule()
-    print(f"Found {len(tomorrow.events)} events for tomorrow.")
-    
-    print("\nGetting week schedule...")
-    week = service.get_week_schedule()
-    print(f"Retrieved schedule for {len(week)} days.")
+    print(f"\nFound {len(tomorrow.events)} events for tomorrow.")
+    print(f"\nRetrieved schedule for {len(week)} days.")
     
     return True
 
+async def _gather_schedules(service):
+    """Fetch today's, tomorrow's and the week's schedules concurrently"""
+    return await asyncio.gather(
+        service.get_today_schedule_async(),
+        service.get_tomorrow_schedule_async(),
+        service.get_week_schedule_async(_week_dates())
+    )
+
 def test_calendar_skill():
     """Test the calendar skill"""
     print("\n" + "="*60)
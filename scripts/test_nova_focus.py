@@ -4,26 +4,24 @@ Test script for Nova's Focus Mode integration
 
 This script tests the integration of Focus Mode control with Nova's brain.
 """
-import sys
-import os
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Import the necessary classes
-from core.brain.router import NovaBrain
+# Shared NovaBrain factory
+from _svc import brain as shared_brain
 
 def test_nova_focus_integration():
     """Test the Focus Mode integration with Nova's brain"""
     print("\n===== Testing Nova Focus Mode Integration =====\n")
     
-    # Create a NovaBrain instance
-    brain = NovaBrain()
+    # Get the shared NovaBrain instance
+    brain = shared_brain()
     
     # Test commands to process
     test_commands = [
@@ -38,12 +36,10 @@ def test_nova_focus_integration():
         "This is not a focus mode command"
     ]
     
-    # Process each command and print the result
-    for command in test_commands:
+    # Process all commands in one batch, then print each result
+    responses = brain.process_batch(test_commands)
+    for command, response in zip(test_commands, responses):
         print(f"Command: \"{command}\"")
-        
-        # Process the command
-        response = brain.process_input(command)
         print(f"Response: \"{response}\"\n")
     
     print("===== Nova Focus Mode Integration Testing Complete =====")
@@ -8,12 +8,12 @@ and process the interruption audio correctly.
 
 import sys
 import os
-import time
+import functools
 import threading
 import argparse
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Import Nova components
 from core.main import HeyNova
@@ -21,6 +21,16 @@ from core.tts import SpeechSynthesizer
 from core.stt import SpeechTranscriber
 from core.audio.interruption_monitor import InterruptionMonitor
 
+@functools.lru_cache(maxsize=1)
+def _synth():
+    """Return the SpeechSynthesizer shared by the tests, creating it on first use"""
+    return SpeechSynthesizer()
+
+@functools.lru_cache(maxsize=1)
+def _transcriber():
+    """Return the SpeechTranscriber shared by the tests, creating it on first use"""
+    return SpeechTranscriber()
+
 def test_interruption_monitor():
     """Test the interruption monitor in isolation"""
     print("\n" + "="*60)
@@ -44,18 +54,17 @@ def test_interruption_monitor():
     print("🗣️ Please speak to test interruption detection")
     monitor.start_monitoring(on_interruption=on_interrupt)
     
-    # Wait for interruption or timeout
+    # Wait for interruption or timeout; the monitor sets the event as soon as
+    # it has handled one, so there's no polling delay
     timeout = 10  # seconds
-    start_time = time.time()
-    while not monitor.was_interrupted and time.time() - start_time < timeout:
-        print("⏳ Waiting for interruption... (speak now)")
-        time.sleep(1)
+    print("⏳ Waiting for interruption... (speak now)")
+    interrupted = monitor.interruption_event.wait(timeout=timeout)
     
-    # Stop monitoring
+    # Stop monitoring (this resets the monitor's interruption state)
     monitor.stop_monitoring()
     
     # Check results
-    if monitor.was_interrupted:
+    if interrupted:
         print("✅ Interruption detected successfully!")
         audio_file = monitor.get_interruption_audio_file()
         if audio_file:
@@ -65,7 +74,7 @@ def test_interruption_monitor():
     else:
         print("❌ No interruption detected within timeout")
     
-    return monitor.was_interrupted
+    return interrupted
 
 def test_tts_interruption():
     """Test interruption during TTS output"""
@@ -73,9 +82,9 @@ def test_tts_interruption():
     print("🧪 TESTING TTS INTERRUPTION")
     print("="*60)
     
-    # Create TTS and STT components
-    tts = SpeechSynthesizer()
-    stt = SpeechTranscriber()
+    # Get the (shared) TTS and STT components
+    tts = _synth()
+    stt = _transcriber()
     
     # Define a long text to speak
     long_text = """
@@ -136,8 +145,8 @@ def test_full_nova_interruption():
     print("🧪 TESTING FULL NOVA INTERRUPTION")
     print("="*60)
     
-    # Create Nova instance
-    nova = HeyNova()
+    # Create Nova instance, reusing the speech components from the TTS test
+    nova = HeyNova(tts=_synth(), stt=_transcriber())
     
     # Directly test the _process_interruption method
     print("🎤 Testing _process_interruption method...")
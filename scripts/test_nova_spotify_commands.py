@@ -10,30 +10,27 @@ This script tests:
 5. Smart context awareness
 """
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+# Shared instances, so both tests reuse one authenticated service
+from _svc import brain as shared_brain, spotify as shared_spotify, buffered_stdout
 
 def test_spotify_command_understanding():
     """Test Nova's understanding of various Spotify-related commands"""
     print("===== Testing Nova's Spotify Command Understanding =====\n")
     
     try:
-        # Import Nova's components
-        print("🔍 Testing Nova component imports...")
-        from core.brain.router import NovaBrain
-        from core.services.spotify_service import SpotifyService
-        print("✅ All Nova components imported successfully")
-        
         # Initialize services
-        print("\n🔍 Initializing services...")
-        spotify = SpotifyService()
-        brain = NovaBrain()
+        print("🔍 Initializing services...")
+        spotify = shared_spotify()
+        brain = shared_brain()
         print("✅ Services initialized")
         
         # Test commands that should work
@@ -91,31 +88,66 @@ def test_spotify_command_understanding():
         print(f"\n🔍 Testing {len(test_commands)} different command types...")
         print("=" * 60)
         
-        # Test each command
-        for i, command in enumerate(test_commands, 1):
-            print(f"\n{i:2d}. Testing: '{command}'")
-            print("-" * 40)
-            
-            try:
-                # Test if Nova understands this command
-                if brain.matches_any_skill(command):
-                    print("✅ Nova recognizes this command")
-                    
-                    # Get which skill matched
-                    matched_skill = brain._get_matching_skill(command)
+        # Match every command once; the skill name also tells us whether Nova
+        # understands it, and is handed to process_input so it isn't matched again
+        matched_skills = [brain._get_matching_skill(command) for command in test_commands]
+        
+        # Read-only Spotify queries (what's playing, playlist info, ...) don't
+        # depend on each other, so a consecutive run of them is processed in
+        # parallel. Each run starts at its place in the sequence, after every
+        # command before it has finished, so queries still see the playback
+        # state left by the commands listed ahead of them.
+        spotify_skill = brain.skill_instances.get('spotify')
+        read_only = [
+            skill == 'spotify' and spotify_skill is not None and spotify_skill.is_read_only_command(command)
+            for command, skill in zip(test_commands, matched_skills)
+        ]
+        
+        # Test each command, collecting the report lines and writing them
+        # out together after the loop
+        lines = []
+        separator = "-" * 40
+        run_futures = {}
+        run_end = 0
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for index, (command, matched_skill) in enumerate(zip(test_commands, matched_skills)):
+                lines.append(f"\n{index + 1:2d}. Testing: '{command}'\n{separator}")
+                
+                # First command of a read-only run: submit the whole run now.
+                # Queries that make the same Spotify call (e.g. "What playlists
+                # do I have?" and "Show me my playlists") share one future, so
+                # each distinct request goes out once per run.
+                if read_only[index] and index >= run_end:
+                    run_end = index
+                    while run_end < len(test_commands) and read_only[run_end]:
+                        run_end += 1
+                    run_futures = {}
+                    futures_by_key = {}
+                    for run_command in test_commands[index:run_end]:
+                        key = spotify_skill.get_request_key(run_command)
+                        if key not in futures_by_key:
+                            futures_by_key[key] = executor.submit(
+                                brain.process_input, run_command, matched_skill='spotify'
+                            )
+                        run_futures[run_command] = futures_by_key[key]
+                
+                try:
                     if matched_skill:
-                        print(f"   Matched skill: {matched_skill}")
+                        lines.append(f"✅ Nova recognizes this command\n   Matched skill: {matched_skill}")
                         
-                        # Process the command
-                        response = brain.process_input(command)
-                        print(f"   Response: {response}")
+                        # Process the command (or collect its parallel result)
+                        if read_only[index]:
+                            response = run_futures[command].result()
+                        else:
+                            response = brain.process_input(command, matched_skill=matched_skill)
+                        lines.append(f"   Response: {response}")
                     else:
-                        print("   No specific skill matched")
-                else:
-                    print("❌ Nova doesn't recognize this command")
-                    
-            except Exception as e:
-                print(f"   ⚠️ Error processing command: {e}")
+                        lines.append("❌ Nova doesn't recognize this command")
+                        
+                except Exception as e:
+                    lines.append(f"   ⚠️ Error processing command: {e}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         print("\n" + "=" * 60)
         print("🎯 Spotify Command Understanding Test Complete!")
@@ -139,9 +171,7 @@ def test_spotify_service_integration():
     print("\n===== Testing Spotify Service Integration =====\n")
     
     try:
-        from core.services.spotify_service import SpotifyService
-        
-        spotify = SpotifyService()
+        spotify = shared_spotify()
         
         if not spotify.is_available():
             print("🔐 Spotify not authenticated, attempting authentication...")
@@ -189,8 +219,9 @@ def main():
     """Run all tests"""
     print("🚀 Starting Comprehensive Nova Spotify Testing\n")
     
-    # Test 1: Command Understanding
-    success1 = test_spotify_command_understanding()
+    # Test 1: Command Understanding (a few hundred lines, written out at once)
+    with buffered_stdout():
+        success1 = test_spotify_command_understanding()
     
     # Test 2: Service Integration
     success2 = test_spotify_service_integration()
@@ -6,11 +6,45 @@ This script allows you to interact with Nova directly through text input.
 Test all of Nova's capabilities including the new text processor.
 """
 
-import sys
+import atexit
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+# Shared NovaBrain factory
+from _svc import brain as shared_brain
+
+# Importing readline gives input() line editing and up-arrow history; it
+# isn't available on every platform, in which case input() works as before
+try:
+    import readline
+except ImportError:
+    readline = None
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".nova", "text_interface_history")
+
+def _enable_history():
+    """Load previous sessions' commands into readline and save them on exit"""
+    if readline is None:
+        return
+    
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First run, or the history file isn't readable
+    readline.set_history_length(1000)
+    
+    def save_history():
+        try:
+            os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    atexit.register(save_history)
 
 def main():
     """Main text interface for Nova"""
@@ -19,11 +53,17 @@ def main():
     print("✅ Initializing Nova...")
     
     try:
-        from core.brain.router import NovaBrain
-        
-        # Initialize Nova
-        brain = NovaBrain()
+        # Get the shared NovaBrain instance
+        brain = shared_brain()
         print("✅ Nova is ready!")
+        
+        try:
+            from core.utils.text_processor import make_speakable
+        except ImportError:
+            make_speakable = None
+        
+        # Worker that runs the text processor while the response is printed
+        executor = ThreadPoolExecutor(max_workers=1)
         print("\n💬 Type your commands below (or type 'exit' to quit):")
         print("\n🎯 Test Categories:")
         print("  📅 Calendar:")
@@ -49,6 +89,8 @@ def main():
         print("    - Show me my recent notes")
         print("\n" + "=" * 60)
         
+        _enable_history()
+        
         # Main command loop
         while True:
             try:
@@ -67,19 +109,19 @@ def main():
                 print("🧠 Nova: Processing...")
                 response = brain.process_input(user_input)
                 
-                # Display response
+                # Start the text processor on the response, then display it
+                speakable = executor.submit(make_speakable, response) if make_speakable else None
                 print(f"🤖 Nova: {response}")
                 
                 # Test text processor on the response
-                try:
-                    from core.utils.text_processor import make_speakable
-                    processed_response = make_speakable(response)
+                if speakable is None:
+                    print("⚠️ Text processor not available")
+                else:
+                    processed_response = speakable.result()
                     if processed_response != response:
                         print(f"🔧 Text Processed: {processed_response}")
                     else:
                         print("✅ Text already in optimal format")
-                except ImportError:
-                    print("⚠️ Text processor not available")
                 
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye! Nova signing off...")
@@ -87,6 +129,8 @@ def main():
             except Exception as e:
                 print(f"❌ Error: {e}")
                 print("Please try again or type 'exit' to quit.")
+        
+        executor.shutdown()
                 
     except Exception as e:
         print(f"❌ Failed to initialize Nova: {e}")
@@ -4,25 +4,30 @@ Test script for Nova's Focus Mode and Welcome Greeting
 
 This script tests Nova's welcome greeting with focus mode integration.
 """
-import sys
-import os
+import functools
 import logging
 import datetime
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Import the necessary classes
-from core.services.focus_controller import FocusController
-from core.services.time_based_focus import TimeBasedFocusController
+from core.utils.time_greeting import get_welcome_greeting
 
-def simulate_greeting(hour):
-    """Simulate Nova's greeting at a specific hour"""
-    print(f"\n===== Simulating greeting at {hour}:00 =====")
+@functools.lru_cache(maxsize=1)
+def _get_active_rules():
+    """Create the focus controllers once and read their active rules
+    
+    The rules are evaluated against the real clock, not the simulated hour,
+    so every evening simulation in a run gets the same answer.
+    """
+    # Only the evening greeting consults the focus rules, so the
+    # controllers are imported and created on first use rather than up front
+    from core.services.focus_controller import FocusController
+    from core.services.time_based_focus import TimeBasedFocusController
     
     # Create focus controller
     focus_controller = FocusController()
@@ -30,16 +35,17 @@ def simulate_greeting(hour):
     # Create time-based focus controller
     time_controller = TimeBasedFocusController(focus_controller)
     
+    return tuple(time_controller.get_active_rules())
+
+def simulate_greeting(hour):
+    """Simulate Nova's greeting at a specific hour"""
+    print(f"\n===== Simulating greeting at {hour}:00 =====")
+    
     # Check if it's evening (after 4 PM)
     is_evening = hour >= 16
     
     # Generate appropriate greeting based on time
-    if 5 <= hour < 12:
-        greeting = "Good morning"
-    elif 12 <= hour < 17:
-        greeting = "Good afternoon"
-    else:
-        greeting = "Good evening"
+    greeting = get_welcome_greeting(hour)
     
     # Base welcome message
     welcome_message = f"{greeting}, sir! Welcome home."
@@ -50,7 +56,7 @@ def simulate_greeting(hour):
         
         # Check if Do Not Disturb would be enabled
         print("Checking if Do Not Disturb would be enabled...")
-        active_rules = time_controller.get_active_rules()
+        active_rules = _get_active_rules()
         print(f"Active rules at {hour}:00: {', '.join(active_rules) if active_rules else 'None'}")
         
         # Simulate enabling Do Not Disturb
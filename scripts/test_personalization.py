@@ -3,17 +3,18 @@
 Test script for Nova's personalization
 Simulates conversation without audio input/output
 """
-import os
-import sys
 import time
 from datetime import datetime
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+
+# Shared NovaBrain factory
+from _svc import brain as shared_brain
 
 # Import Nova components
 from core.config import config
-from core.brain.router import NovaBrain
+from core.utils.time_greeting import get_time_greeting
 
 def simulate_conversation():
     """Simulate a conversation with Nova"""
@@ -21,21 +22,11 @@ def simulate_conversation():
     print("🌟 Nova Personalization Test")
     print("="*60)
     
-    # Initialize brain
-    brain = NovaBrain()
+    # Get the shared NovaBrain instance
+    brain = shared_brain()
     
     # Get current time for greeting
-    now = datetime.now()
-    hour = now.hour
-    
-    if 5 <= hour < 12:
-        greeting = "Good morning"
-    elif 12 <= hour < 17:
-        greeting = "Good afternoon"
-    elif 17 <= hour < 21:
-        greeting = "Good evening"
-    else:
-        greeting = "Good night"
+    greeting = get_time_greeting(datetime.now().hour)
     
     # Simulate Nova's welcome message
     welcome_message = f"{greeting}, {config.user_title}! Welcome home. How may I serve you today?"
@@ -6,18 +6,33 @@ This script tests the actual calendar service to ensure it's pulling
 real data from Google Calendar and personal_config.py, not just
 placeholder information.
 """
-import sys
-import os
+import asyncio
 import logging
-from datetime import datetime, date
+from datetime import date
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
+from _svc import line_buffered_stdout
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+async def _fetch_today(calendar_service, today):
+    """Fetch today's schedule and, if Google Calendar is connected, its raw
+    events for today concurrently
+    
+    Returns (today_schedule, google_events); google_events is None when
+    Google Calendar isn't available.
+    """
+    google_calendar = getattr(calendar_service, 'google_calendar', None)
+    if google_calendar and google_calendar.is_available():
+        return await asyncio.gather(
+            calendar_service.get_today_schedule_async(),
+            google_calendar.get_calendar_events_async(today)
+        )
+    return await calendar_service.get_today_schedule_async(), None
+
 def test_real_calendar_data():
     """Test that Nova is reading real calendar data"""
     print("===== Testing Real Calendar Data =====")
@@ -28,13 +43,17 @@ def test_real_calendar_data():
         # Initialize the calendar service
         calendar_service = CalendarService()
         
-        # Get today's date
+        # Get today's date and its weekday name once, for every test below
         today = date.today()
-        print(f"\n📅 Today's date: {today.strftime('%A, %B %d, %Y')}")
+        weekday_name = today.strftime("%A")
+        print(f"\n📅 Today's date: {weekday_name}, {today.strftime('%B %d, %Y')}")
+        
+        # Today's schedule (Test 1) and the raw Google events (Test 4) are
+        # independent requests, so both are fetched up front, concurrently
+        today_schedule, google_events = asyncio.run(_fetch_today(calendar_service, today))
         
         # Test 1: Get today's schedule
         print("\n🔍 Test 1: Getting today's schedule...")
-        today_schedule = calendar_service.get_today_schedule()
         print(f"Found {len(today_schedule.events)} events for today")
         
         if today_schedule.events:
@@ -47,9 +66,10 @@ def test_real_calendar_data():
         else:
             print("No events scheduled for today")
         
-        # Test 2: Get rest of day schedule
+        # Test 2: Get rest of day schedule (filtered from the schedule above
+        # rather than fetched again)
         print("\n🔍 Test 2: Getting rest of day schedule...")
-        rest_of_day = calendar_service.get_rest_of_day_schedule()
+        rest_of_day = calendar_service.get_rest_of_day_schedule(today_schedule)
         print(f"Found {len(rest_of_day)} upcoming events for the rest of today")
         
         if rest_of_day:
@@ -63,7 +83,7 @@ def test_real_calendar_data():
         
         # Test 3: Format the rest of day schedule (what Nova actually says)
         print("\n🔍 Test 3: What Nova would actually say...")
-        formatted_message = calendar_service.format_rest_of_day_schedule()
+        formatted_message = calendar_service.format_rest_of_day_schedule(rest_of_day)
         print(f"Nova would say: \"{formatted_message}\"")
         
         # Test 4: Check if Google Calendar is available
@@ -72,9 +92,8 @@ def test_real_calendar_data():
             if calendar_service.google_calendar and calendar_service.google_calendar.is_available():
                 print("✅ Google Calendar is available and connected")
                 
-                # Try to get some Google Calendar events
+                # Google Calendar events fetched alongside today's schedule
                 try:
-                    google_events = calendar_service.google_calendar.get_calendar_events(today)
                     print(f"Found {len(google_events)} Google Calendar events for today")
                     for event in google_events:
                         print(f"  • {event.get('title', 'Untitled')} at {event.get('start_time', 'No time')}")
@@ -92,11 +111,12 @@ def test_real_calendar_data():
         print(f"Personal config has {len(COURSES)} courses and {len(ACTIVITIES)} activities")
         
         # Check if today's courses are in the schedule
-        weekday = today.strftime("%A")
-        print(f"Today is {weekday}")
+        print(f"Today is {weekday_name}")
         
-        today_courses = [course for course in COURSES if weekday in course.get("days", [])]
-        print(f"Personal config shows {len(today_courses)} courses for {weekday}:")
+        # NovaConfig indexes the personal config's courses by weekday at load
+        from core.config import config
+        today_courses = config.courses_by_day.get(weekday_name, ())
+        print(f"Personal config shows {len(today_courses)} courses for {weekday_name}:")
         for course in today_courses:
             print(f"  • {course['name']} ({course['code']}) at {course['time']}")
         
@@ -108,4 +128,5 @@ def test_real_calendar_data():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    line_buffered_stdout()
     test_real_calendar_data()
@@ -7,83 +7,131 @@ This bypasses the Spotify API and uses macOS AppleScript to control Spotify dire
 import os
 import sys
 import time
+import asyncio
 import subprocess
 
+# Report whether Spotify was already running, then bring it to the front
+ACTIVATE_SCRIPT = '''
+set wasRunning to application "Spotify" is running
+tell application "Spotify" to activate
+return wasRunning
+'''
+
+# Track name, artist and player state in one osascript call, one per line.
+# The track fields are left empty if nothing is loaded.
+TRACK_INFO_SCRIPT = '''
+tell application "Spotify"
+    set trackName to ""
+    set trackArtist to ""
+    try
+        set trackName to name of current track as string
+        set trackArtist to artist of current track as string
+    end try
+    return trackName & linefeed & trackArtist & linefeed & (player state as string)
+end tell
+'''
+
+# Play/pause/play priming cycle, run as one script
+PRIME_DEVICE_SCRIPT = '''
+tell application "Spotify"
+    play
+    delay 2
+    pause
+    delay 1
+    play
+    delay 1
+end tell
+'''
+
+VOLUME_SCRIPT = 'tell application "Spotify" to set sound volume to 50'
+
+PLAY_SCRIPT = 'tell application "Spotify" to play'
+
+# The search command is different in AppleScript for Spotify, so we play a
+# specific playlist instead. Playlist URI comes from the environment variable
+# or the default
+NIGHTMODE_PLAYLIST_URI = os.getenv('NIGHTMODE_PLAYLIST_URI', 'spotify:playlist:1x7x1Q7CWyodqzTiiSMNKC')
+PLAY_NIGHTMODE_SCRIPT = f'tell application "Spotify" to play track "{NIGHTMODE_PLAYLIST_URI}"'
+
+def parse_track_info(output):
+    """Split TRACK_INFO_SCRIPT output into (track, artist, player state)"""
+    track, artist, state = output.rstrip("\n").split("\n")
+    return track, artist, state
+
+def run_osa(script):
+    """Run an AppleScript with osascript and return its output
+    
+    osascript inherits no descriptors we care about and needs no shell, so
+    the child skips closing the parent's fd table (close_fds=False).
+    Raises CalledProcessError if the script fails.
+    """
+    result = subprocess.run(
+        ["osascript", "-e", script],
+        capture_output=True, text=True, check=True, close_fds=False
+    )
+    return result.stdout
+
+def get_track_info():
+    """Return (track, artist, player state) from a single osascript call"""
+    return parse_track_info(run_osa(TRACK_INFO_SCRIPT))
+
+async def osa(script):
+    """Run an AppleScript in its own osascript process and return its output"""
+    proc = await asyncio.create_subprocess_exec(
+        "osascript", "-e", script,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        close_fds=False
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, "osascript", stdout, stderr)
+    return stdout.decode()
+
+async def verify_and_set_volume():
+    """Read the track info and set the volume concurrently (they're independent)
+    
+    Returns the two results (or the exception each raised), in that order.
+    """
+    return await asyncio.gather(osa(TRACK_INFO_SCRIPT), osa(VOLUME_SCRIPT), return_exceptions=True)
+
 def test_spotify_applescript():
     """Test Spotify control via AppleScript"""
     print("\n🎵 Testing Spotify Control via AppleScript 🎵")
     print("=" * 50)
     
-    # Check if Spotify is running
-    print("\n1. Checking if Spotify is running...")
+    # Check if Spotify is running, then launch/activate it (bring to front),
+    # in a single osascript call; activate also launches it if needed
+    print("\n1. Checking if Spotify is running and activating it...")
     try:
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "System Events" to (name of processes) contains "Spotify"'],
-            capture_output=True, text=True, check=True
-        )
-        app_running = result.stdout.strip().lower() == "true"
+        was_running = run_osa(ACTIVATE_SCRIPT).strip().lower() == "true"
         
-        if not app_running:
-            print("🚀 Launching Spotify...")
-            subprocess.run(["open", "-a", "Spotify"], check=True)
-            print("✅ Spotify launch command sent")
-            time.sleep(3)  # Wait for Spotify to start
+        if not was_running:
+            print("🚀 Spotify was not running, launched it")
+            time.sleep(3)  # Wait for Spotify to finish starting up
         else:
             print("✅ Spotify is already running")
-    except Exception as e:
-        print(f"❌ Error checking/launching Spotify: {e}")
-        return False
-    
-    # Activate Spotify (bring to front)
-    print("\n2. Activating Spotify...")
-    try:
-        subprocess.run(["osascript", "-e", 'tell application "Spotify" to activate'], check=True)
         print("✅ Spotify activated")
         time.sleep(1)
     except Exception as e:
-        print(f"❌ Error activating Spotify: {e}")
+        print(f"❌ Error checking/launching Spotify: {e}")
         return False
     
-    # Get current track info
-    print("\n3. Getting current track info...")
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "Spotify" to name of current track as string'],
-            capture_output=True, text=True, check=True
-        )
-        current_track = result.stdout.strip()
-        
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "Spotify" to artist of current track as string'],
-            capture_output=True, text=True, check=True
-        )
-        current_artist = result.stdout.strip()
-        
-        print(f"🎵 Current track: {current_track} by {current_artist}")
-    except Exception as e:
-        print(f"⚠️ Could not get track info: {e}")
-    
-    # Get player state
-    print("\n4. Getting player state...")
+    # Get current track info and player state (one osascript call)
+    print("\n2. Getting current track info and player state...")
     try:
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "Spotify" to player state as string'],
-            capture_output=True, text=True, check=True
-        )
-        player_state = result.stdout.strip()
+        current_track, current_artist, player_state = get_track_info()
+        if current_track:
+            print(f"🎵 Current track: {current_track} by {current_artist}")
+        else:
+            print("⚠️ Could not get track info: no current track")
         print(f"🎮 Player state: {player_state}")
     except Exception as e:
-        print(f"❌ Error getting player state: {e}")
+        print(f"❌ Error getting track info and player state: {e}")
     
     # Search for Nightmode playlist
-    print("\n5. Searching for Nightmode playlist...")
+    print("\n3. Searching for Nightmode playlist...")
     try:
-        # The search command is different in AppleScript for Spotify
-        # We'll try to play a specific playlist instead
-        # Get playlist URI from environment variable or use default
-        playlist_uri = os.getenv('NIGHTMODE_PLAYLIST_URI', 'spotify:playlist:1x7x1Q7CWyodqzTiiSMNKC')
-        search_cmd = f'tell application "Spotify" to play track "{playlist_uri}"'
-        subprocess.run(["osascript", "-e", search_cmd], check=True)
+        run_osa(PLAY_NIGHTMODE_SCRIPT)
         print("✅ Play Nightmode playlist command sent")
         time.sleep(2)  # Wait for search results
     except Exception as e:
@@ -91,75 +139,42 @@ def test_spotify_applescript():
         
         # Fallback to just playing whatever is currently loaded
         try:
-            play_cmd = 'tell application "Spotify" to play'
-            subprocess.run(["osascript", "-e", play_cmd], check=True)
+            run_osa(PLAY_SCRIPT)
             print("✅ Generic play command sent as fallback")
         except Exception as e:
             print(f"❌ Fallback play failed: {e}")
     
     # Prime device with play/pause cycle
-    print("\n6. Priming device with play/pause cycle...")
+    print("\n4. Priming device with play/pause cycle...")
     try:
-        # Play
-        play_cmd = 'tell application "Spotify" to play'
-        subprocess.run(["osascript", "-e", play_cmd], check=True)
-        print("✅ Play command sent")
-        time.sleep(2)
-        
-        # Pause
-        pause_cmd = 'tell application "Spotify" to pause'
-        subprocess.run(["osascript", "-e", pause_cmd], check=True)
-        print("✅ Pause command sent")
-        time.sleep(1)
-        
-        # Play again
-        play_cmd = 'tell application "Spotify" to play'
-        subprocess.run(["osascript", "-e", play_cmd], check=True)
-        print("✅ Second play command sent")
-        time.sleep(1)
+        run_osa(PRIME_DEVICE_SCRIPT)
+        print("✅ Play, pause and second play commands sent")
     except Exception as e:
         print(f"❌ Error during device priming: {e}")
     
-    # Verify playback
-    print("\n7. Verifying playback...")
+    # Verify playback and set volume; both osascript calls run concurrently
+    track_output, volume_result = asyncio.run(verify_and_set_volume())
+    
+    print("\n5. Verifying playback...")
     try:
-        result = subprocess.run(
-            ["osascript", "-e", 'tell application "Spotify" to player state as string'],
-            capture_output=True, text=True, check=True
-        )
-        player_state = result.stdout.strip()
+        if isinstance(track_output, Exception):
+            raise track_output
+        current_track, current_artist, player_state = parse_track_info(track_output)
         print(f"🎮 Player state: {player_state}")
         
         if player_state.lower() == "playing":
             print("✅ Music is playing!")
-            
-            # Get current track info again
-            result = subprocess.run(
-                ["osascript", "-e", 'tell application "Spotify" to name of current track as string'],
-                capture_output=True, text=True, check=True
-            )
-            current_track = result.stdout.strip()
-            
-            result = subprocess.run(
-                ["osascript", "-e", 'tell application "Spotify" to artist of current track as string'],
-                capture_output=True, text=True, check=True
-            )
-            current_artist = result.stdout.strip()
-            
             print(f"🎵 Now playing: {current_track} by {current_artist}")
         else:
             print("❌ Music is not playing")
     except Exception as e:
         print(f"❌ Error verifying playback: {e}")
     
-    # Set volume
-    print("\n8. Setting volume to 50%...")
-    try:
-        volume_cmd = 'tell application "Spotify" to set sound volume to 50'
-        subprocess.run(["osascript", "-e", volume_cmd], check=True)
+    print("\n6. Setting volume to 50%...")
+    if isinstance(volume_result, Exception):
+        print(f"❌ Error setting volume: {volume_result}")
+    else:
         print("✅ Volume set to 50%")
-    except Exception as e:
-        print(f"❌ Error setting volume: {e}")
     
     print("\n" + "=" * 50)
     print("🎵 AppleScript test completed")
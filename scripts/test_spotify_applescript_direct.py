@@ -3,8 +3,6 @@
 Test the SpotifyAppleScript class.
 """
 
-import os
-import sys
 import time
 import logging
 
@@ -14,8 +12,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Import the SpotifyAppleScript class
 from core.services.spotify_applescript import SpotifyAppleScript
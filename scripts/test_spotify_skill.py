@@ -8,14 +8,13 @@ This script tests the Spotify skill's ability to:
 3. Handle various command formats
 """
 import sys
-import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 def test_spotify_skill():
     """Test the Spotify skill's command recognition and processing"""
@@ -4,13 +4,11 @@ Test script for the new Spotify state machine.
 This script tests the robust Spotify playback state machine.
 """
 
-import os
-import sys
 import time
 from dotenv import load_dotenv
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Load environment variables
 load_dotenv()
@@ -5,14 +5,12 @@ Test script for Time-Based Focus Mode Controller
 This script tests the TimeBasedFocusController class to verify it can properly
 apply focus mode rules based on time of day.
 """
-import sys
-import os
 import time
 import datetime
 import logging
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -5,14 +5,12 @@ Test script for Nova's updated welcome greeting
 This script tests Nova's welcome greeting at different times of day
 to verify the updated format with private mode, calendar info, and productive day message.
 """
-import sys
-import os
 import logging
 from datetime import datetime
 import unittest.mock
 
-# Add the parent directory to the path so we can import the core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -20,18 +18,14 @@ logging.basicConfig(level=logging.INFO,
 
 # Import the calendar service for mocking
 from core.services.calendar_service import CalendarService
+from core.utils.time_greeting import get_welcome_greeting
 
 def simulate_greeting(hour, calendar_message="You have nothing scheduled for the rest of the day."):
     """Simulate Nova's greeting at a specific hour"""
     print(f"\n===== Simulating greeting at {hour}:00 =====")
     
     # Determine greeting based on time of day
-    if 5 <= hour < 12:
-        greeting = "Good morning"
-    elif 12 <= hour < 17:
-        greeting = "Good afternoon"
-    else:
-        greeting = "Good evening"
+    greeting = get_welcome_greeting(hour)
     
     # Base welcome message
     welcome_message = f"{greeting}, Sir! Welcome home."
@@ -5,10 +5,13 @@ Script to update the Notion API token in the .env file
 import os
 import sys
 
+# Project root (parent of the scripts directory)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 def update_notion_token():
     """Update the Notion API token in the .env file"""
     # Get the path to the .env file
-    env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
+    env_path = os.path.join(PROJECT_ROOT, '.env')
     
     # Check if .env file exists
     if not os.path.exists(env_path):
@@ -3,12 +3,10 @@ verify note formatting in the notes app
 
 this script creates a note with specific formatting and then displays how it would appear.
 """
-import sys
-import os
 import subprocess
 
-# add the project root to python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 # import the app control service
 from core.services.app_control_service import AppControlService
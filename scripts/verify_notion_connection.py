@@ -3,13 +3,12 @@
 Script to verify Notion API connection
 """
 import os
-import sys
 import json
 import requests
 from dotenv import load_dotenv
 
-# Add the core directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Put the project root on the path so we can import the core modules
+import _bootstrap  # noqa: F401
 
 def verify_notion_connection():
     """Verify the Notion API connection"""